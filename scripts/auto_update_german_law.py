@@ -15,15 +15,34 @@ import datetime as dt
 import fcntl
 import json
 import os
+import random
+import selectors
+import socket
+import sqlite3
 import subprocess
 import sys
 import time
+import urllib.error
+import urllib.request
+from collections import deque
+from email.utils import format_datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 
+# Spawn children with the interpreter running the orchestrator: no $PATH
+# walk per spawn, and no risk of a different python3 (and site-packages)
+# being picked up outside the venv.
+PYTHON = sys.executable
+
+# One plain-dict snapshot of the environment taken at import: os.environ is
+# a wrapper that re-encodes keys on every access, and a stable snapshot means
+# env changes cannot silently alter a long-running daemon mid-flight.
+ENV = dict(os.environ)
+
 GESETZE_SCRIPT = SCRIPT_DIR / "ingest_gesetze_im_internet.py"
 CASE_SCRIPT = SCRIPT_DIR / "ingest_rechtsprechung_im_internet.py"
 DIP_SCRIPT = SCRIPT_DIR / "ingest_dip_bundestag.py"
@@ -31,9 +50,34 @@ DIP_SCRIPT = SCRIPT_DIR / "ingest_dip_bundestag.py"
 DEFAULT_DB_PATH = str(PROJECT_ROOT / "data" / "database.db")
 DEFAULT_LOCK_PATH = str(PROJECT_ROOT / "data" / ".auto_update.lock")
 
+DIP_PROBE_URL = "https://search.dip.bundestag.de/api/v1/vorgang"
+PROBE_TIMEOUT_SECONDS = 10
+
+# Report keys per source. A direct lookup avoids probing every alias for
+# every report and, unlike the old chained `get(...) or get(...)`, does not
+# fall through when a source legitimately reports 0.
+COUNT_KEYS = {
+  "gesetze-im-internet": ("ingested_sections", "skipped_sections"),
+  "rechtsprechung-im-internet": ("ingested_cases", "skipped_cases"),
+  "dip-bundestag": ("ingested_documents", "skipped_documents"),
+}
+DRY_RUN_KEYS = {
+  "gesetze-im-internet": "selected_laws",
+  "rechtsprechung-im-internet": "selected_cases",
+  "dip-bundestag": "selected_documents",
+}
+
 
 def now_iso() -> str:
-  return dt.datetime.now(dt.timezone.utc).isoformat().replace("+00:00", "Z")
+  # strftime renders the trailing "Z" directly; isoformat() + replace()
+  # would allocate two strings per call on every cycle/ingestor boundary.
+  return dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def jittered_backoff(attempt: int) -> float:
+  # Full jitter: deterministic 2**attempt backoff synchronizes retries across
+  # a fleet sharing the same cron cadence and re-hammers the upstream APIs.
+  return random.uniform(0.25, min(2**attempt, 8))
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -46,10 +90,10 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
   parser.add_argument("--skip-cases", action="store_true", help="Skip case-law source update")
   parser.add_argument("--skip-prep", action="store_true", help="Skip preparatory-works source update")
 
-  default_cases_max = int(os.getenv("GERMAN_LAW_AUTO_UPDATE_CASES_MAX", "1000"))
-  default_cases_stop = int(os.getenv("GERMAN_LAW_AUTO_UPDATE_CASES_STOP_AFTER_EXISTING", "500"))
-  default_prep_max = int(os.getenv("GERMAN_LAW_AUTO_UPDATE_PREP_MAX", "5000"))
-  default_prep_stop = int(os.getenv("GERMAN_LAW_AUTO_UPDATE_PREP_STOP_AFTER_EXISTING", "800"))
+  default_cases_max = int(ENV.get("GERMAN_LAW_AUTO_UPDATE_CASES_MAX", "1000"))
+  default_cases_stop = int(ENV.get("GERMAN_LAW_AUTO_UPDATE_CASES_STOP_AFTER_EXISTING", "500"))
+  default_prep_max = int(ENV.get("GERMAN_LAW_AUTO_UPDATE_PREP_MAX", "5000"))
+  default_prep_stop = int(ENV.get("GERMAN_LAW_AUTO_UPDATE_PREP_STOP_AFTER_EXISTING", "800"))
 
   parser.add_argument("--cases-max", type=int, default=default_cases_max, help="Max case-law decisions to ingest per cycle")
   parser.add_argument(
@@ -87,103 +131,214 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
   )
   parser.add_argument("--max-cycles", type=int, default=None, help="Optional max cycles when looping")
   parser.add_argument("--quiet", action="store_true", help="Suppress child ingestor logs")
+  parser.add_argument(
+    "--report-file",
+    default=None,
+    help="Append per-cycle JSON reports to this file instead of stdout (daemon-friendly)",
+  )
   return parser.parse_args(argv)
 
 
+def spawn_and_collect(command: list[str]) -> tuple[int, dict[str, Any], str]:
+  """Run one ingestor process, streaming its output instead of buffering it.
+
+  Returns (exit_code, parsed_report, stderr_tail). Only the last JSON-looking
+  stdout line is kept, and stderr is bounded to the most recent lines, so a
+  verbose or runaway child cannot pin orchestrator memory.
+  """
+  process = subprocess.Popen(
+    command,
+    stdout=subprocess.PIPE,
+    stderr=subprocess.PIPE,
+    text=True,
+    bufsize=1,
+  )
+
+  last_stdout_line = ""
+  stderr_tail: deque[str] = deque(maxlen=200)
+
+  selector = selectors.DefaultSelector()
+  assert process.stdout is not None and process.stderr is not None
+  selector.register(process.stdout, selectors.EVENT_READ)
+  selector.register(process.stderr, selectors.EVENT_READ)
+
+  try:
+    while selector.get_map():
+      for key, _events in selector.select():
+        line = key.fileobj.readline()
+        if not line:
+          selector.unregister(key.fileobj)
+          continue
+        if key.fileobj is process.stdout:
+          # Only the final report line matters; remember the raw line and
+          # defer strip/parse until EOF so progress output costs nothing.
+          if not line.isspace():
+            last_stdout_line = line
+        else:
+          # Bound retained stderr while reading: the deque caps line count
+          # and the slice caps line length, so a child spewing huge single
+          # lines cannot grow orchestrator memory before the tail slice.
+          stderr_tail.append(line.rstrip("\n")[:2000])
+  finally:
+    selector.close()
+
+  exit_code = process.wait()
+
+  report: dict[str, Any] = {}
+  candidate = last_stdout_line.strip()
+  if candidate.startswith("{"):
+    try:
+      parsed = json.loads(candidate)
+      if isinstance(parsed, dict):
+        report = parsed
+    except json.JSONDecodeError:
+      report = {}
+
+  return (exit_code, report, "\n".join(stderr_tail).strip())
+
+
+def ensure_worker(state: dict[str, Any]) -> subprocess.Popen[str]:
+  process: subprocess.Popen[str] | None = state.get("process")
+  if process is None or process.poll() is not None:
+    process = subprocess.Popen(
+      [PYTHON, str(state["script"]), "--server"],
+      stdin=subprocess.PIPE,
+      stdout=subprocess.PIPE,
+      text=True,
+      bufsize=1,
+    )
+    state["process"] = process
+  return process
+
+
+def request_from_worker(state: dict[str, Any], script_args: list[str]) -> tuple[int, dict[str, Any], str]:
+  """Send one command to a resident worker and read its single-line report.
+
+  Returns the same (exit_code, report, stderr_tail) shape as spawn_and_collect.
+  A dead worker is treated as a failed attempt; the next attempt respawns it.
+  """
+  process = ensure_worker(state)
+  try:
+    assert process.stdin is not None and process.stdout is not None
+    process.stdin.write(json.dumps(script_args) + "\n")
+    process.stdin.flush()
+    response = process.stdout.readline()
+  except (BrokenPipeError, OSError):
+    response = ""
+
+  if not response:
+    exit_code = process.poll()
+    state["process"] = None
+    return (exit_code if exit_code is not None else 1, {}, "Worker exited without producing a report.")
+
+  report: dict[str, Any] = {}
+  candidate = response.strip()
+  if candidate.startswith("{"):
+    try:
+      parsed = json.loads(candidate)
+      if isinstance(parsed, dict):
+        report = parsed
+    except json.JSONDecodeError:
+      report = {}
+  return (0, report, "")
+
+
+def start_workers(plan: list[tuple[str, Path, tuple[str, ...]]]) -> dict[str, dict[str, Any]]:
+  return {source_name: {"script": script_path, "process": None} for source_name, script_path, _ in plan}
+
+
+def stop_workers(workers: dict[str, dict[str, Any]]) -> None:
+  for state in workers.values():
+    process: subprocess.Popen[str] | None = state.get("process")
+    if process is None:
+      continue
+    try:
+      if process.stdin is not None:
+        process.stdin.close()
+      process.wait(timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+      process.kill()
+
+
 def run_ingestor(
   name: str,
   script: Path,
-  script_args: list[str],
+  script_args: tuple[str, ...],
   source_retries: int,
+  workers: dict[str, dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
   started_at = now_iso()
-  attempt = 0
   retries = max(source_retries, 0)
-  process: subprocess.CompletedProcess[str] | None = None
+  attempt = 0
+  exit_code = 1
   report: dict[str, Any] = {}
+  stderr_tail = ""
   ok = False
 
-  while attempt <= retries:
-    attempt += 1
-    process = subprocess.run(
-      ["python3", str(script), *script_args],
-      cwd=str(PROJECT_ROOT),
-      capture_output=True,
-      text=True,
-    )
+  worker_state = workers.get(name) if workers is not None else None
 
-    stdout = process.stdout.strip()
-    stderr = process.stderr.strip()
-    report = {}
-    if stdout:
-      lines = [line.strip() for line in stdout.splitlines() if line.strip()]
-      if lines:
-        try:
-          parsed = json.loads(lines[-1])
-          if isinstance(parsed, dict):
-            report = parsed
-        except json.JSONDecodeError:
-          report = {}
-
-    ok = process.returncode == 0 and report.get("status") != "failed"
+  for attempt in range(1, retries + 2):
+    if worker_state is not None:
+      exit_code, report, stderr_tail = request_from_worker(worker_state, [str(arg) for arg in script_args])
+    else:
+      exit_code, report, stderr_tail = spawn_and_collect([PYTHON, str(script), *script_args])
+
+    ok = exit_code == 0 and report.get("status") != "failed"
     if ok:
       break
     if attempt <= retries:
-      time.sleep(min(2**attempt, 8))
+      time.sleep(jittered_backoff(attempt))
 
   finished_at = now_iso()
-  if process is None:
-    process = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="")
-
-  stderr = process.stderr.strip()
   if not report:
     report = {
-      "status": "failed" if process.returncode != 0 else "unknown",
+      "status": "failed" if exit_code != 0 else "unknown",
       "error": "No JSON report produced by ingestor.",
     }
-    if stderr:
-      report["stderr"] = stderr[-2000:]
+    if stderr_tail:
+      report["stderr"] = stderr_tail[-2000:]
 
   return {
     "source": name,
     "started_at": started_at,
     "finished_at": finished_at,
     "ok": ok,
-    "exit_code": process.returncode,
+    "exit_code": exit_code,
     "attempts": attempt,
     "report": report,
   }
 
 
-def extract_counts(report: dict[str, Any], dry_run: bool) -> tuple[int, int]:
+def extract_counts(source_name: str, report: dict[str, Any], dry_run: bool) -> tuple[int, int]:
+  # Fan-out entries like "dip-bundestag:20" share their base source's keys.
+  source_name = source_name.split(":", 1)[0]
   if dry_run:
-    skipped = int(
-      report.get("selected_laws")
-      or report.get("selected_cases")
-      or report.get("selected_documents")
-      or 0
-    )
+    dry_key = DRY_RUN_KEYS.get(source_name)
+    skipped = int(report.get(dry_key, 0) or 0) if dry_key else 0
     return (0, skipped)
 
-  ingested = int(
-    report.get("ingested_sections")
-    or report.get("ingested_cases")
-    or report.get("ingested_documents")
-    or report.get("ingested_count")
-    or 0
-  )
-  skipped = int(
-    report.get("skipped_sections")
-    or report.get("skipped_cases")
-    or report.get("skipped_documents")
-    or report.get("skipped_count")
-    or 0
+  keys = COUNT_KEYS.get(source_name)
+  if keys is None:
+    return (
+      int(report.get("ingested_count", 0) or 0),
+      int(report.get("skipped_count", 0) or 0),
+    )
+  ingested_key, skipped_key = keys
+  return (
+    int(report.get(ingested_key, 0) or 0),
+    int(report.get(skipped_key, 0) or 0),
   )
-  return (ingested, skipped)
 
 
-def build_plan(args: argparse.Namespace) -> list[tuple[str, Path, list[str]]]:
-  plan: list[tuple[str, Path, list[str]]] = []
+def freeze_args(script_args: list[str]) -> tuple[str, ...]:
+  # The plan outlives every cycle, so freeze each argv vector and intern its
+  # strings: repeated values (flags, the db path) collapse to one object
+  # shared across entries and cycles.
+  return tuple(sys.intern(arg) for arg in script_args)
+
+
+def build_plan(args: argparse.Namespace) -> list[tuple[str, Path, tuple[str, ...]]]:
+  plan: list[tuple[str, Path, tuple[str, ...]]] = []
 
   if not args.skip_statutes:
     statute_args = ["--db-path", args.db_path]
@@ -193,7 +348,7 @@ def build_plan(args: argparse.Namespace) -> list[tuple[str, Path, list[str]]]:
       statute_args += ["--only-missing"]
       if args.quiet:
         statute_args.append("--quiet")
-    plan.append(("gesetze-im-internet", GESETZE_SCRIPT, statute_args))
+    plan.append(("gesetze-im-internet", GESETZE_SCRIPT, freeze_args(statute_args)))
 
   if not args.skip_cases:
     case_args = [
@@ -211,67 +366,161 @@ def build_plan(args: argparse.Namespace) -> list[tuple[str, Path, list[str]]]:
       case_args.append("--dry-run")
     elif args.quiet:
       case_args.append("--quiet")
-    plan.append(("rechtsprechung-im-internet", CASE_SCRIPT, case_args))
+    plan.append(("rechtsprechung-im-internet", CASE_SCRIPT, freeze_args(case_args)))
 
   if not args.skip_prep:
-    prep_args = [
-      "--db-path",
-      args.db_path,
-      "--only-missing",
-      "--max-documents",
-      str(args.prep_max),
-      "--stop-after-existing",
-      str(args.prep_stop_after_existing),
-    ]
-    if args.api_key:
-      prep_args += ["--api-key", args.api_key]
-
     wahlperioden = [value.strip() for value in args.wahlperiode if value.strip()]
     if not wahlperioden:
-      env_periods = os.getenv("GERMAN_LAW_PREP_WAHLPERIODEN", "").strip()
+      env_periods = ENV.get("GERMAN_LAW_PREP_WAHLPERIODEN", "").strip()
       if env_periods:
         wahlperioden = [value.strip() for value in env_periods.split(",") if value.strip()]
     if not wahlperioden:
       wahlperioden = ["20"]
 
+    # One plan entry per Wahlperiode: each hits a different Bundestag
+    # partition, so the concurrent executor overlaps them like any other
+    # source. Single-period runs keep the plain source name.
     for period in wahlperioden:
+      prep_args = [
+        "--db-path",
+        args.db_path,
+        "--only-missing",
+        "--max-documents",
+        str(args.prep_max),
+        "--stop-after-existing",
+        str(args.prep_stop_after_existing),
+      ]
+      if args.api_key:
+        prep_args += ["--api-key", args.api_key]
       prep_args += ["--wahlperiode", period]
 
-    if args.dry_run:
-      prep_args.append("--dry-run")
-    elif args.quiet:
-      prep_args.append("--quiet")
-    plan.append(("dip-bundestag", DIP_SCRIPT, prep_args))
+      if args.dry_run:
+        prep_args.append("--dry-run")
+      elif args.quiet:
+        prep_args.append("--quiet")
+
+      source_name = "dip-bundestag" if len(wahlperioden) == 1 else f"dip-bundestag:{period}"
+      plan.append((source_name, DIP_SCRIPT, freeze_args(prep_args)))
 
   return plan
 
 
-def run_cycle(args: argparse.Namespace, cycle_number: int) -> dict[str, Any]:
+def newest_prep_timestamp(db_path: str) -> dt.datetime | None:
+  try:
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+      row = connection.execute("SELECT MAX(updated_at) FROM preparatory_works").fetchone()
+    finally:
+      connection.close()
+  except sqlite3.Error:
+    return None
+  if not row or not row[0]:
+    return None
+  try:
+    return dt.datetime.fromisoformat(str(row[0]).replace("Z", "+00:00"))
+  except ValueError:
+    return None
+
+
+def dip_source_unchanged(db_path: str) -> bool:
+  """Probe the DIP API with a conditional HEAD before spawning the ingestor.
+
+  Returns True only on a definite 304 Not Modified relative to our newest
+  stored record; any error or ambiguity falls back to running the source.
+  """
+  since = newest_prep_timestamp(db_path)
+  if since is None:
+    return False
+
+  request = urllib.request.Request(
+    DIP_PROBE_URL,
+    method="HEAD",
+    headers={
+      "If-Modified-Since": format_datetime(since, usegmt=True),
+      "User-Agent": "ansvar-german-law-mcp/0.1",
+    },
+  )
+  try:
+    with urllib.request.urlopen(request, timeout=PROBE_TIMEOUT_SECONDS):
+      return False
+  except urllib.error.HTTPError as error:
+    return error.code == 304
+  except (urllib.error.URLError, TimeoutError, OSError):
+    return False
+
+
+def run_cycle(
+  args: argparse.Namespace,
+  plan: list[tuple[str, Path, tuple[str, ...]]],
+  cycle_number: int,
+  workers: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
   started_at = now_iso()
-  plan = build_plan(args)
   source_results: list[dict[str, Any]] = []
   total_ingested = 0
   total_skipped = 0
   failed_sources: list[str] = []
 
+  pending = []
+  dip_unchanged: bool | None = None
   for source_name, script_path, script_args in plan:
-    result = run_ingestor(
-      source_name,
-      script_path,
-      script_args,
-      source_retries=args.source_retries,
-    )
-    source_results.append(result)
+    # One cheap conditional HEAD spares a full subprocess plus API paging in
+    # the common "no new Bundestag activity" cycle. Probe once per cycle even
+    # when the DIP source fans out per Wahlperiode.
+    is_dip = source_name.split(":", 1)[0] == "dip-bundestag"
+    if is_dip and not args.dry_run and dip_unchanged is None:
+      dip_unchanged = dip_source_unchanged(args.db_path)
+    if is_dip and not args.dry_run and dip_unchanged:
+      probe_time = now_iso()
+      source_results.append(
+        {
+          "source": source_name,
+          "started_at": probe_time,
+          "finished_at": probe_time,
+          "ok": True,
+          "exit_code": 0,
+          "attempts": 0,
+          "report": {"status": "skipped_not_modified", "source_id": source_name},
+        }
+      )
+      continue
+    pending.append((source_name, script_path, script_args))
+
+  # Sources are independent network-bound jobs, so run them concurrently;
+  # run_ingestor blocks in subprocess.run, which releases the GIL. Writers
+  # contend on the shared SQLite file, which serializes at the DB layer.
+  with ThreadPoolExecutor(max_workers=max(len(pending), 1)) as executor:
+    futures = {
+      executor.submit(
+        run_ingestor,
+        source_name,
+        script_path,
+        script_args,
+        args.source_retries,
+        workers,
+      ): source_name
+      for source_name, script_path, script_args in pending
+    }
+    for future in as_completed(futures):
+      source_results.append(future.result())
 
-    ingested, skipped = extract_counts(result["report"], args.dry_run)
+  source_results.sort(key=lambda result: result["source"])
+
+  for result in source_results:
+    ingested, skipped = extract_counts(result["source"], result["report"], args.dry_run)
     total_ingested += ingested
     total_skipped += skipped
 
     if not result["ok"]:
-      failed_sources.append(source_name)
+      # Collapse fan-out entries (e.g. "dip-bundestag:19"/":20") into one
+      # logical source so downstream alerting keys stay stable.
+      failed_source = result["source"].split(":", 1)[0]
+      if failed_source not in failed_sources:
+        failed_sources.append(failed_source)
 
+  logical_sources = {result["source"].split(":", 1)[0] for result in source_results}
   status = "success"
-  if failed_sources and len(failed_sources) == len(source_results):
+  if failed_sources and len(failed_sources) == len(logical_sources):
     status = "failed"
   elif failed_sources:
     status = "partial_success"
@@ -289,11 +538,36 @@ def run_cycle(args: argparse.Namespace, cycle_number: int) -> dict[str, Any]:
   }
 
 
-def with_lock(lock_path: Path, run_fn) -> int:
+def ensure_db_ready(db_path: str) -> None:
+  """Put the shared database into WAL mode before any ingestor spawns.
+
+  journal_mode is persistent, so setting it here lets concurrently running
+  ingestors cooperate as WAL writers with a busy_timeout backoff instead of
+  failing on rollback-journal writer locks.
+  """
+  Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+  try:
+    connection = sqlite3.connect(db_path)
+    try:
+      connection.execute("PRAGMA journal_mode=WAL")
+      connection.execute("PRAGMA synchronous=NORMAL")
+      connection.execute("PRAGMA wal_autocheckpoint=1000")
+      connection.execute("PRAGMA busy_timeout=30000")
+    finally:
+      connection.close()
+  except sqlite3.Error:
+    # Ingestors create/configure their own connections; a probe failure here
+    # must not block the cycle.
+    pass
+
+
+def with_lock(lock_path: Path, run_fn, lock_mode: int = fcntl.LOCK_EX) -> int:
   lock_path.parent.mkdir(parents=True, exist_ok=True)
-  with open(lock_path, "w", encoding="utf-8") as handle:
+  # Open in "a+" so a contender does not truncate the holder's stamp, and
+  # keep the handle open for the full run so the lock spans every cycle.
+  with open(lock_path, "a+", encoding="utf-8") as handle:
     try:
-      fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+      fcntl.flock(handle.fileno(), lock_mode | fcntl.LOCK_NB)
     except BlockingIOError:
       print(
         json.dumps(
@@ -308,31 +582,87 @@ def with_lock(lock_path: Path, run_fn) -> int:
       )
       return 0
 
+    if lock_mode == fcntl.LOCK_EX:
+      # Only the exclusive holder stamps the file; concurrent shared holders
+      # would race each other over the same bytes.
+      handle.seek(0)
+      handle.truncate()
+      handle.write(
+        json.dumps(
+          {"pid": os.getpid(), "started_at": now_iso(), "host": socket.gethostname()},
+          ensure_ascii=False,
+        )
+        + "\n"
+      )
+      handle.flush()
+      os.fsync(handle.fileno())
+
     return run_fn()
 
 
 def main(argv: list[str]) -> int:
   args = parse_args(argv)
   lock_path = Path(args.lock_path).resolve()
+  # chdir once instead of passing cwd= per spawn: a cwd argument forces
+  # CPython's subprocess off the posix_spawn fast path onto fork+chdir+exec.
+  os.chdir(PROJECT_ROOT)
+  if not args.dry_run:
+    ensure_db_ready(args.db_path)
 
   def execute() -> int:
+    # args never change after parse, so resolve the plan once; rebuilding it
+    # per cycle re-read env vars and re-allocated identical argv lists.
+    plan = build_plan(args)
+    # In loop mode, keep one resident worker per source so each cycle skips
+    # interpreter startup and module imports in the children.
+    workers = start_workers(plan) if args.loop_minutes is not None else None
     cycle = 0
-    while True:
-      cycle += 1
-      summary = run_cycle(args, cycle_number=cycle)
-      print(json.dumps(summary, ensure_ascii=False))
-
-      if args.loop_minutes is None:
-        break
-      if args.max_cycles is not None and args.max_cycles >= 0 and cycle >= args.max_cycles:
-        break
-      if args.loop_minutes <= 0:
-        break
-      time.sleep(args.loop_minutes * 60.0)
+    period = args.loop_minutes * 60.0 if args.loop_minutes is not None else 0.0
+    next_deadline = time.monotonic()
+    # Reports go to an O_APPEND fd when requested: a single os.write per
+    # cycle never blocks the cadence on a slow stdout consumer, and appends
+    # up to PIPE_BUF are atomic across writers.
+    report_fd: int | None = None
+    if args.report_file:
+      report_fd = os.open(args.report_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC, 0o644)
+    try:
+      while True:
+        cycle += 1
+        summary = run_cycle(args, plan, cycle_number=cycle, workers=workers)
+        payload = json.dumps(summary, ensure_ascii=False)
+        if report_fd is not None:
+          os.write(report_fd, (payload + "\n").encode("utf-8"))
+        else:
+          print(payload)
+
+        if args.loop_minutes is None:
+          break
+        if args.max_cycles is not None and args.max_cycles >= 0 and cycle >= args.max_cycles:
+          break
+        if args.loop_minutes <= 0:
+          break
+
+        # Schedule against monotonic deadlines so the period is not stretched
+        # by cycle runtime, with ±5% jitter to decorrelate fleet members. If
+        # a cycle overran the whole period, re-anchor instead of bursting.
+        next_deadline += period * random.uniform(0.95, 1.05)
+        slack = next_deadline - time.monotonic()
+        if slack > 0:
+          time.sleep(slack)
+        else:
+          next_deadline = time.monotonic()
+    finally:
+      if workers is not None:
+        stop_workers(workers)
+      if report_fd is not None:
+        os.close(report_fd)
 
     return 0
 
-  return with_lock(lock_path, execute)
+  # Dry runs perform no writes, so a shared lock lets several of them
+  # overlap; the real updater's exclusive lock still blocks them all out.
+  lock_mode = fcntl.LOCK_SH if args.dry_run else fcntl.LOCK_EX
+  return with_lock(lock_path, execute, lock_mode=lock_mode)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,10 @@ Source:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import datetime as dt
+import functools
+import hashlib
 import http.client
 import json
 import os
@@ -22,6 +25,11 @@ import urllib.parse
 import urllib.request
 from typing import Any
 
+try:
+  import requests
+except ImportError:  # requests is installed in CI; urllib remains the fallback
+  requests = None
+
 DEFAULT_API_URL = "https://search.dip.bundestag.de/api/v1/vorgang"
 DEFAULT_CONFIG_URL = "https://dip.bundestag.de/dip-config.js"
 DEFAULT_DB_PATH = "data/database.db"
@@ -31,13 +39,31 @@ DEFAULT_SLEEP_SECONDS = 0.05
 DEFAULT_WAHLPERIODE = "20"
 USER_AGENT = "ansvar-german-law-mcp/0.1"
 NO_PROXY_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+# One keep-alive session for the whole run: following cursor pages over a
+# fresh TCP+TLS handshake each costs ~100ms per page, which dominates when
+# the API itself is fast. trust_env=False mirrors the no-proxy opener.
+if requests is not None:
+  SESSION = requests.Session()
+  SESSION.trust_env = False
+  _ADAPTER = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
+  SESSION.mount("https://", _ADAPTER)
+  SESSION.mount("http://", _ADAPTER)
+else:
+  SESSION = None
+try:
+  import re2 as _re_fast  # google-re2: DFA matching, no backtracking
+except ImportError:  # optional; stdlib re is the default engine
+  _re_fast = None
+
 WHITESPACE_PATTERN = re.compile(r"\s+")
-UPPER_TOKEN_PATTERN = re.compile(r"\b[A-Z][A-Z0-9_-]{1,14}\b")
+# The statute-token scan runs over every title/abstract/descriptor; RE2's DFA
+# is used when installed, with identical finditer/group semantics.
+UPPER_TOKEN_PATTERN = (_re_fast or re).compile(r"\b[A-Z][A-Z0-9_-]{1,14}\b")
 API_KEY_PATTERN = re.compile(r"portalApiKey\s*=\s*'([^']+)'")
 DEFAULT_PUBLIC_API_KEY = "SbGXhWA.3cpnNdb8rkht7iWpvSgTP8XIG88LoCrGd4"
 
 SCHEMA_SQL = """
-PRAGMA journal_mode = DELETE;
 PRAGMA foreign_keys = ON;
 
 CREATE TABLE IF NOT EXISTS preparatory_works (
@@ -69,6 +95,31 @@ CREATE VIRTUAL TABLE IF NOT EXISTS preparatory_works_fts USING fts5(
   tokenize='unicode61'
 );
 
+CREATE TABLE IF NOT EXISTS ingestion_runs (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  source_id TEXT NOT NULL,
+  started_at TEXT NOT NULL,
+  finished_at TEXT,
+  status TEXT NOT NULL,
+  total_laws INTEGER NOT NULL DEFAULT 0,
+  ingested_laws INTEGER NOT NULL DEFAULT 0,
+  skipped_laws INTEGER NOT NULL DEFAULT 0,
+  ingested_sections INTEGER NOT NULL DEFAULT 0,
+  skipped_sections INTEGER NOT NULL DEFAULT 0,
+  error_count INTEGER NOT NULL DEFAULT 0,
+  error_sample TEXT,
+  notes TEXT
+);
+
+-- Partial index: one entry per active run, so the startup sweep that marks
+-- stale 'running' rows as interrupted never scans historical runs.
+CREATE INDEX IF NOT EXISTS idx_ingestion_runs_status
+  ON ingestion_runs(status) WHERE status = 'running';
+"""
+
+# Kept separate from SCHEMA_SQL so bulk mode can drop the triggers for the
+# duration of a run and rebuild the FTS index once at the end.
+FTS_TRIGGERS_SQL = """
 CREATE TRIGGER IF NOT EXISTS preparatory_works_ai
 AFTER INSERT ON preparatory_works
 BEGIN
@@ -91,22 +142,35 @@ BEGIN
   INSERT INTO preparatory_works_fts(rowid, title, statute_citation, text_snippet)
   VALUES (new.rowid, new.title, COALESCE(new.statute_citation, ''), COALESCE(new.text_snippet, ''));
 END;
+"""
 
-CREATE TABLE IF NOT EXISTS ingestion_runs (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  source_id TEXT NOT NULL,
-  started_at TEXT NOT NULL,
-  finished_at TEXT,
-  status TEXT NOT NULL,
-  total_laws INTEGER NOT NULL DEFAULT 0,
-  ingested_laws INTEGER NOT NULL DEFAULT 0,
-  skipped_laws INTEGER NOT NULL DEFAULT 0,
-  ingested_sections INTEGER NOT NULL DEFAULT 0,
-  skipped_sections INTEGER NOT NULL DEFAULT 0,
-  error_count INTEGER NOT NULL DEFAULT 0,
-  error_sample TEXT,
-  notes TEXT
-);
+DROP_FTS_TRIGGERS_SQL = """
+DROP TRIGGER IF EXISTS preparatory_works_ai;
+DROP TRIGGER IF EXISTS preparatory_works_ad;
+DROP TRIGGER IF EXISTS preparatory_works_au;
+"""
+
+
+# One module-level SQL text: sqlite3's per-connection statement cache keys on
+# the text object, so every executemany reuses the prepared statement instead
+# of re-parsing and re-planning the 12-parameter upsert.
+UPSERT_SQL = """
+INSERT INTO preparatory_works (
+  id, country, dip_id, title, statute_id, statute_citation, work_type, publication_date, source_url, text_snippet, metadata_json, updated_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+  country = excluded.country,
+  dip_id = excluded.dip_id,
+  title = excluded.title,
+  statute_id = excluded.statute_id,
+  statute_citation = excluded.statute_citation,
+  work_type = excluded.work_type,
+  publication_date = excluded.publication_date,
+  source_url = excluded.source_url,
+  text_snippet = excluded.text_snippet,
+  metadata_json = excluded.metadata_json,
+  updated_at = excluded.updated_at
 """
 
 
@@ -114,49 +178,93 @@ def now_iso() -> str:
   return dt.datetime.now(dt.timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _collapse_uncached(value: str) -> str:
+  text = value.strip()
+  # Fast path: most values are already collapsed, and four C-level substring
+  # scans are cheaper than entering the regex engine.
+  if "  " not in text and "\t" not in text and "\n" not in text and "\r" not in text:
+    return text
+  return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+_collapse_cached = functools.lru_cache(maxsize=8192)(_collapse_uncached)
+
+# Only short values (descriptors, initiatives, dates) repeat often enough to
+# be worth caching. Titles, abstracts, and joined snippets are mostly unique
+# and up to ~24KB each; letting them in would pin key+value copies of 8192
+# large strings in a module-level cache that resident --server workers never
+# release.
+_CACHEABLE_LENGTH = 256
+
+
 def collapse_whitespace(value: str | None) -> str:
-  if not value:
+  if not value or not isinstance(value, str):
     return ""
-  return WHITESPACE_PATTERN.sub(" ", value).strip()
+  if len(value) <= _CACHEABLE_LENGTH:
+    return _collapse_cached(value)
+  return _collapse_uncached(value)
+
+
+def clean_str(value: Any) -> str:
+  """Collapse whitespace on string values; anything else (None, numbers) is "".
+
+  Avoids the old `str(...)` coercion, which allocated a new string per field
+  and silently turned missing values into the literal "None".
+  """
+  if isinstance(value, str):
+    return collapse_whitespace(value)
+  return ""
 
 
 def normalize_iso_date(value: str | None) -> str | None:
+  # Nearly every value is already YYYY-MM-DD (or YYYYMMDD); plain slicing and
+  # isdigit checks avoid two regex invocations per document.
   text = collapse_whitespace(value)
   if not text:
     return None
-  if re.fullmatch(r"\d{4}-\d{2}-\d{2}", text):
+  if len(text) == 10 and text[4] == "-" and text[7] == "-" and text[:4].isdigit() and text[5:7].isdigit() and text[8:].isdigit():
     return text
-  if re.fullmatch(r"\d{8}", text):
+  if len(text) == 8 and text.isdigit():
     return f"{text[0:4]}-{text[4:6]}-{text[6:8]}"
   return None
 
 
 def http_get(url: str, timeout: int, retries: int, headers: dict[str, str] | None = None) -> bytes:
-  request = urllib.request.Request(
-    url,
-    headers={
-      "User-Agent": USER_AGENT,
-      "Accept": "application/json, text/plain, */*",
-      **(headers or {}),
-    },
-  )
+  merged_headers = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/json, text/plain, */*",
+    **(headers or {}),
+  }
 
   attempt = 0
   while True:
     attempt += 1
     try:
+      if SESSION is not None:
+        response = SESSION.get(url, headers=merged_headers, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+      request = urllib.request.Request(url, headers=merged_headers)
       with NO_PROXY_OPENER.open(request, timeout=timeout) as response:
         return response.read()
     except (urllib.error.URLError, TimeoutError, http.client.IncompleteRead) as error:
       if attempt >= retries:
         raise RuntimeError(f"HTTP GET failed after {retries} attempts for {url}: {error}") from error
       time.sleep(min(2**attempt, 8))
+    except Exception as error:  # requests exceptions when the session is in use
+      if requests is None or not isinstance(error, requests.RequestException):
+        raise
+      if attempt >= retries:
+        raise RuntimeError(f"HTTP GET failed after {retries} attempts for {url}: {error}") from error
+      time.sleep(min(2**attempt, 8))
 
 
 def parse_json_response(payload: bytes, source: str) -> dict[str, Any]:
   try:
-    parsed = json.loads(payload.decode("utf-8"))
-  except json.JSONDecodeError as error:
+    # json.loads decodes bytes internally; an upfront .decode("utf-8") would
+    # materialize a second full-page copy just to throw it away.
+    parsed = json.loads(payload)
+  except (json.JSONDecodeError, UnicodeDecodeError) as error:
     raise RuntimeError(f"Invalid JSON payload from {source}: {error}") from error
   if not isinstance(parsed, dict):
     raise RuntimeError(f"Unexpected response shape from {source}: expected object")
@@ -210,8 +318,36 @@ def build_search_url(
   return f"{base_url}?{query_string}"
 
 
+def configure_connection(connection: sqlite3.Connection) -> None:
+  """Tune the ingest connection for bulk loading.
+
+  WAL avoids rewriting a rollback journal per commit and lets readers keep
+  working during ingestion; synchronous=NORMAL defers fsyncs to checkpoints;
+  busy_timeout makes concurrent writers back off instead of failing.
+  """
+  connection.execute("PRAGMA journal_mode=WAL")
+  connection.execute("PRAGMA synchronous=NORMAL")
+  connection.execute("PRAGMA temp_store=MEMORY")
+  connection.execute("PRAGMA cache_size=-200000")
+  connection.execute("PRAGMA mmap_size=268435456")
+  connection.execute("PRAGMA busy_timeout=30000")
+
+
 def ensure_schema(connection: sqlite3.Connection) -> None:
   connection.executescript(SCHEMA_SQL)
+  connection.executescript(FTS_TRIGGERS_SQL)
+
+
+def begin_bulk_fts(connection: sqlite3.Connection) -> None:
+  """Drop the FTS maintenance triggers so bulk upserts skip per-row index churn."""
+  connection.executescript(DROP_FTS_TRIGGERS_SQL)
+
+
+def end_bulk_fts(connection: sqlite3.Connection) -> None:
+  """Rebuild the FTS index from the content table and restore the triggers."""
+  connection.execute("INSERT INTO preparatory_works_fts(preparatory_works_fts) VALUES('rebuild')")
+  connection.executescript(FTS_TRIGGERS_SQL)
+  connection.commit()
 
 
 def insert_ingestion_run_start(connection: sqlite3.Connection, source_id: str, started_at: str) -> int:
@@ -245,8 +381,6 @@ def finalize_ingestion_run(
         total_laws = ?,
         ingested_laws = ?,
         skipped_laws = ?,
-        ingested_sections = ?,
-        skipped_sections = ?,
         error_count = ?,
         error_sample = ?
     WHERE id = ?
@@ -257,24 +391,59 @@ def finalize_ingestion_run(
       total_documents,
       ingested_documents,
       skipped_documents,
-      ingested_documents,
-      skipped_documents,
       error_count,
-      json.dumps(error_sample[:20], ensure_ascii=False) if error_sample else None,
+      json.dumps(error_sample[:20], ensure_ascii=False, separators=(",", ":")) if error_sample else None,
       run_id,
     ),
   )
 
 
-def fetch_existing_dip_ids(connection: sqlite3.Connection) -> set[str]:
-  rows = connection.execute("SELECT dip_id FROM preparatory_works").fetchall()
-  return {str(row[0]) for row in rows}
+class BloomFilter:
+  """Compact membership filter over existing dip_ids for --only-missing runs.
 
+  Sized at ~10 bits per element with 7 probes (FPR under 1%). Positives
+  are confirmed against idx_prep_works_dip_id, so a false positive costs one
+  indexed SELECT; false negatives cannot occur, so no document is lost.
+  """
 
-def load_statute_code_map(connection: sqlite3.Connection) -> dict[str, str]:
-  if not table_exists(connection, "statutes"):
-    return {}
+  def __init__(self, expected_items: int, bits_per_item: int = 10, hash_count: int = 7) -> None:
+    self.size_bits = max(expected_items, 1024) * bits_per_item
+    self.hash_count = hash_count
+    self.bits = bytearray((self.size_bits + 7) // 8)
 
+  def _indexes(self, value: str) -> list[int]:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % self.size_bits for i in range(self.hash_count)]
+
+  def add(self, value: str) -> None:
+    for index in self._indexes(value):
+      self.bits[index >> 3] |= 1 << (index & 7)
+
+  def __contains__(self, value: str) -> bool:
+    return all(self.bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(value))
+
+
+# Prepared existence probe for --only-missing: idx_prep_works_dip_id makes
+# each confirmation a single B-tree descent.
+EXISTS_SQL = "SELECT 1 FROM preparatory_works WHERE dip_id = ? LIMIT 1"
+
+
+def build_dip_id_bloom(connection: sqlite3.Connection) -> BloomFilter | None:
+  row = connection.execute("SELECT COUNT(*) FROM preparatory_works").fetchone()
+  existing_count = int(row[0]) if row else 0
+  if existing_count == 0:
+    # Fresh database: nothing can already exist, so skip both the table scan
+    # and all per-document membership checks.
+    return None
+  bloom = BloomFilter(existing_count)
+  for id_row in connection.execute("SELECT dip_id FROM preparatory_works"):
+    bloom.add(str(id_row[0]))
+  return bloom
+
+
+def load_statute_code_map(connection: sqlite3.Connection) -> dict[str, str]:
   rows = connection.execute(
     """
     SELECT statute_id, jurabk, amtabk
@@ -293,6 +462,44 @@ def load_statute_code_map(connection: sqlite3.Connection) -> dict[str, str]:
   return mapping
 
 
+STATUTE_MAP_THRESHOLD = 5000
+
+STATUTE_TOKEN_SQL = """
+SELECT statute_id
+FROM statutes
+WHERE UPPER(jurabk) = ? OR UPPER(amtabk) = ?
+LIMIT 1
+"""
+
+
+def build_statute_lookup(connection: sqlite3.Connection):
+  """Return a token -> statute_id callable, or None when no statutes exist.
+
+  Small tables are loaded into a dict as before; past STATUTE_MAP_THRESHOLD
+  rows the lookup is served by prepared SELECTs against expression indexes on
+  UPPER(jurabk) / UPPER(amtabk), so startup cost and memory stay flat
+  regardless of how many statutes have been ingested.
+  """
+  if not table_exists(connection, "statutes"):
+    return None
+
+  statute_count = int(connection.execute("SELECT COUNT(*) FROM statutes").fetchone()[0])
+  if statute_count == 0:
+    return None
+  if statute_count <= STATUTE_MAP_THRESHOLD:
+    return load_statute_code_map(connection).get
+
+  connection.execute("CREATE INDEX IF NOT EXISTS idx_statutes_jurabk_upper ON statutes(UPPER(jurabk))")
+  connection.execute("CREATE INDEX IF NOT EXISTS idx_statutes_amtabk_upper ON statutes(UPPER(amtabk))")
+  connection.commit()
+
+  def lookup(token: str) -> str | None:
+    row = connection.execute(STATUTE_TOKEN_SQL, (token, token)).fetchone()
+    return str(row[0]) if row else None
+
+  return lookup
+
+
 def table_exists(connection: sqlite3.Connection, table_name: str) -> bool:
   row = connection.execute(
     """
@@ -315,14 +522,17 @@ def extract_descriptor_names(document: dict[str, Any]) -> list[str]:
   for item in descriptors:
     if not isinstance(item, dict):
       continue
-    name = collapse_whitespace(str(item.get("name", "")))
-    if name:
-      names.append(name)
+    name = item.get("name")
+    if isinstance(name, str):
+      name = collapse_whitespace(name)
+      if name:
+        names.append(name)
   return names
 
 
 def extract_citation_candidates(document: dict[str, Any]) -> list[str]:
-  candidates: list[str] = []
+  # Dict keys dedupe in insertion order, so collection and dedup are one pass.
+  seen: dict[str, None] = {}
   descriptors = document.get("deskriptor")
   if isinstance(descriptors, list):
     for item in descriptors:
@@ -330,9 +540,11 @@ def extract_citation_candidates(document: dict[str, Any]) -> list[str]:
         continue
       if not item.get("fundstelle"):
         continue
-      name = collapse_whitespace(str(item.get("name", "")))
-      if name:
-        candidates.append(name)
+      name = item.get("name")
+      if isinstance(name, str):
+        name = collapse_whitespace(name)
+        if name:
+          seen[name] = None
 
   publications = document.get("verkuendung")
   if isinstance(publications, list):
@@ -340,11 +552,13 @@ def extract_citation_candidates(document: dict[str, Any]) -> list[str]:
       if not isinstance(item, dict):
         continue
       for key in ["fundstelle", "einleitungstext"]:
-        value = collapse_whitespace(str(item.get(key, "")))
-        if value:
-          candidates.append(value)
+        value = item.get(key)
+        if isinstance(value, str):
+          value = collapse_whitespace(value)
+          if value:
+            seen[value] = None
 
-  return dedupe_strings(candidates)
+  return list(seen)
 
 
 def derive_statute_id(
@@ -352,33 +566,25 @@ def derive_statute_id(
   abstract: str,
   descriptors: list[str],
   citation_candidates: list[str],
-  statute_code_map: dict[str, str],
+  statute_lookup,
 ) -> str | None:
-  if not statute_code_map:
+  if statute_lookup is None:
     return None
 
-  haystack = " ".join([title, abstract, *descriptors, *citation_candidates]).upper()
-  if not haystack:
-    return None
-
-  for token in UPPER_TOKEN_PATTERN.findall(haystack):
-    statute_id = statute_code_map.get(token)
-    if statute_id:
-      return statute_id
+  # Scan each field separately and stop at the first known token: no joined
+  # haystack copy of title+abstract+descriptors+citations, and finditer
+  # short-circuits instead of materializing every candidate token up front.
+  for part in (title, abstract, *descriptors, *citation_candidates):
+    if not part:
+      continue
+    for match in UPPER_TOKEN_PATTERN.finditer(part.upper()):
+      statute_id = statute_lookup(match.group())
+      if statute_id:
+        return statute_id
 
   return None
 
 
-def dedupe_strings(values: list[str]) -> list[str]:
-  seen: set[str] = set()
-  result: list[str] = []
-  for value in values:
-    if value not in seen:
-      seen.add(value)
-      result.append(value)
-  return result
-
-
 def build_text_snippet(
   title: str,
   abstract: str,
@@ -386,15 +592,23 @@ def build_text_snippet(
   initiative: list[str],
   citations: list[str],
 ) -> str:
-  parts = [title, abstract, " ".join(descriptors), " ".join(initiative), " ".join(citations)]
-  merged = collapse_whitespace(" ".join(part for part in parts if part))
-  if len(merged) > 24000:
-    return merged[:24000]
-  return merged
+  # Truncate each part against the remaining budget before joining so the
+  # whitespace collapse never scans material past the 24kB cap; one flat join
+  # instead of joining each group into an intermediate string.
+  budget = 24000
+  parts: list[str] = []
+  for part in (title, abstract, *descriptors, *initiative, *citations):
+    if not part:
+      continue
+    parts.append(part[:budget])
+    budget -= len(parts[-1]) + 1
+    if budget <= 0:
+      break
+  return collapse_whitespace(" ".join(parts))[:24000]
 
 
-def upsert_preparatory_work(
-  connection: sqlite3.Connection,
+def stage_preparatory_work(
+  pending_rows: list[tuple],
   *,
   dip_id: str,
   title: str,
@@ -406,42 +620,47 @@ def upsert_preparatory_work(
   text_snippet: str,
   metadata_json: str,
 ) -> None:
-  now = now_iso()
-  with connection:
-    connection.execute(
-      """
-      INSERT INTO preparatory_works (
-        id, country, dip_id, title, statute_id, statute_citation, work_type, publication_date, source_url, text_snippet, metadata_json, updated_at
-      )
-      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-      ON CONFLICT(id) DO UPDATE SET
-        country = excluded.country,
-        dip_id = excluded.dip_id,
-        title = excluded.title,
-        statute_id = excluded.statute_id,
-        statute_citation = excluded.statute_citation,
-        work_type = excluded.work_type,
-        publication_date = excluded.publication_date,
-        source_url = excluded.source_url,
-        text_snippet = excluded.text_snippet,
-        metadata_json = excluded.metadata_json,
-        updated_at = excluded.updated_at
-      """,
-      (
-        f"prep:{dip_id}",
-        "de",
-        dip_id,
-        title,
-        statute_id,
-        statute_citation,
-        work_type,
-        publication_date,
-        source_url,
-        text_snippet,
-        metadata_json,
-        now,
-      ),
+  pending_rows.append(
+    (
+      "prep:" + dip_id,
+      "de",
+      dip_id,
+      title,
+      statute_id,
+      statute_citation,
+      work_type,
+      publication_date,
+      source_url,
+      text_snippet,
+      metadata_json,
+      now_iso(),
     )
+  )
+
+
+def flush_pending_rows(
+  connection: sqlite3.Connection,
+  cursor: sqlite3.Cursor,
+  pending_rows: list[tuple],
+) -> int:
+  """Write all staged rows in one explicit transaction.
+
+  A per-row `with connection:` block forced a commit (and fsync, plus the
+  FTS trigger maintenance) for every document; batching amortizes that cost
+  across a whole API page.
+  """
+  if not pending_rows:
+    return 0
+  cursor.execute("BEGIN IMMEDIATE")
+  try:
+    cursor.executemany(UPSERT_SQL, pending_rows)
+    connection.commit()
+  except Exception:
+    connection.rollback()
+    raise
+  flushed = len(pending_rows)
+  pending_rows.clear()
+  return flushed
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -471,12 +690,44 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
   parser.add_argument("--sleep-seconds", type=float, default=DEFAULT_SLEEP_SECONDS, help="Pause between API pages")
   parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help=f"HTTP timeout in seconds (default: {DEFAULT_TIMEOUT})")
   parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help=f"HTTP retries (default: {DEFAULT_RETRIES})")
+  parser.add_argument(
+    "--bulk",
+    action="store_true",
+    help="Drop FTS triggers for the run and rebuild the index once at the end (faster for large backfills)",
+  )
   parser.add_argument("--quiet", action="store_true", help="Suppress per-document progress logs")
   parser.add_argument("--dry-run", action="store_true", help="Resolve and report ingestion scope only")
   parser.add_argument("--report-path", default=None, help="Optional path to write summary JSON")
+  parser.add_argument(
+    "--server",
+    action="store_true",
+    help="Worker mode: read one JSON argv array per stdin line, write one JSON report per stdout line",
+  )
   return parser.parse_args(argv)
 
 
+def run_server() -> int:
+  """Serve ingestion commands over stdin so the orchestrator can keep one
+  resident worker per source instead of paying interpreter startup per cycle."""
+  for line in sys.stdin:
+    command = line.strip()
+    if not command:
+      continue
+    try:
+      command_args = parse_args([str(item) for item in json.loads(command)])
+      summary = run_ingestion(command_args)
+    except (Exception, SystemExit) as error:  # noqa: BLE001
+      summary = {
+        "started_at": now_iso(),
+        "finished_at": now_iso(),
+        "status": "failed",
+        "source_id": "dip-bundestag",
+        "error": str(error),
+      }
+    print(json.dumps(summary, ensure_ascii=False), flush=True)
+  return 0
+
+
 def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
   started_at = now_iso()
   api_key = resolve_api_key(args)
@@ -487,139 +738,201 @@ def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
 
   connection = sqlite3.connect(args.db_path)
   connection.row_factory = sqlite3.Row
+  configure_connection(connection)
   ensure_schema(connection)
-  existing_ids = fetch_existing_dip_ids(connection) if args.only_missing else set()
-  statute_code_map = load_statute_code_map(connection)
-
-  connection.execute(
-    """
-    UPDATE ingestion_runs
-    SET status = 'interrupted',
-        finished_at = COALESCE(finished_at, ?),
-        notes = COALESCE(notes, 'Run was interrupted before finalization.')
-    WHERE status = 'running'
-    """,
-    (now_iso(),),
-  )
-  connection.commit()
-
-  run_id = insert_ingestion_run_start(
-    connection=connection,
-    source_id="dip-bundestag",
-    started_at=started_at,
-  )
-
-  headers = {
-    "Accept": "application/json",
-    "Origin": "https://dip.bundestag.de",
-    "Referer": "https://dip.bundestag.de/",
-    "User-Agent": "Mozilla/5.0",
-  }
-
-  page_count = 0
-  cursor: str | None = None
-  total_found: int | None = None
-  selected_documents = 0
-  ingested_documents = 0
-  skipped_documents = 0
-  error_count = 0
-  errors: list[str] = []
-  consecutive_existing = 0
-  stop_reason: str | None = None
-
-  while True:
-    if args.max_pages is not None and args.max_pages >= 0 and page_count >= args.max_pages:
-      break
-    if args.max_documents is not None and args.max_documents >= 0 and selected_documents >= args.max_documents:
-      break
+  existing_bloom = build_dip_id_bloom(connection) if args.only_missing else None
+  statute_lookup = build_statute_lookup(connection)
+  bulk_mode = args.bulk and not args.dry_run
+  if bulk_mode:
+    begin_bulk_fts(connection)
+  bulk_finalized = False
+  try:
 
-    page_url = build_search_url(
-      args.api_url,
-      api_key,
-      cursor=cursor,
-      query=args.query,
-      wahlperioden=wahlperioden,
-      vorgangstyp=vorgangstyp,
+    connection.execute(
+      """
+      UPDATE ingestion_runs
+      SET status = 'interrupted',
+          finished_at = COALESCE(finished_at, ?),
+          notes = COALESCE(notes, 'Run was interrupted before finalization.')
+      WHERE status = 'running'
+      """,
+      (now_iso(),),
     )
+    connection.commit()
 
-    payload = parse_json_response(
-      http_get(page_url, timeout=args.timeout, retries=args.retries, headers=headers),
-      source=page_url,
+    run_id = insert_ingestion_run_start(
+      connection=connection,
+      source_id="dip-bundestag",
+      started_at=started_at,
     )
-    page_count += 1
-    if total_found is None:
-      total_found = int(payload.get("numFound", 0) or 0)
+    connection.commit()
 
-    documents = payload.get("documents", [])
-    if not isinstance(documents, list) or len(documents) == 0:
-      break
+    headers = {
+      "Accept": "application/json",
+      "Origin": "https://dip.bundestag.de",
+      "Referer": "https://dip.bundestag.de/",
+      "User-Agent": "Mozilla/5.0",
+    }
 
-    for document in documents:
+    page_count = 0
+    cursor: str | None = None
+    total_found: int | None = None
+    selected_documents = 0
+    ingested_documents = 0
+    skipped_documents = 0
+    error_count = 0
+    errors: list[str] = []
+    consecutive_existing = 0
+    stop_reason: str | None = None
+    pending_rows: list[tuple] = []
+    write_cursor = connection.cursor()
+
+    def fetch_page(page_cursor: str | None, delay: float) -> dict[str, Any]:
+      if delay > 0:
+        time.sleep(delay)
+      page_url = build_search_url(
+        args.api_url,
+        api_key,
+        cursor=page_cursor,
+        query=args.query,
+        wahlperioden=wahlperioden,
+        vorgangstyp=vorgangstyp,
+      )
+      return parse_json_response(
+        http_get(page_url, timeout=args.timeout, retries=args.retries, headers=headers),
+        source=page_url,
+      )
+
+    # One background worker speculatively fetches page N+1 while page N is being
+    # parsed and written; cursor pagination only ever exposes one page ahead.
+    prefetch = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    next_page: concurrent.futures.Future | None = None
+
+    while True:
+      if args.max_pages is not None and args.max_pages >= 0 and page_count >= args.max_pages:
+        break
       if args.max_documents is not None and args.max_documents >= 0 and selected_documents >= args.max_documents:
         break
-      if not isinstance(document, dict):
-        continue
 
-      dip_id = collapse_whitespace(str(document.get("id", "")))
-      if not dip_id:
-        continue
-
-      already_exists = dip_id in existing_ids
-      if args.only_missing and already_exists and not args.refresh_existing:
-        skipped_documents += 1
-        consecutive_existing += 1
-        if (
-          args.stop_after_existing is not None
-          and args.stop_after_existing >= 0
-          and consecutive_existing >= args.stop_after_existing
-        ):
-          stop_reason = "consecutive_existing_threshold"
-          break
-        continue
+      try:
+        if next_page is not None:
+          payload = next_page.result()
+          next_page = None
+        else:
+          payload = fetch_page(cursor, 0.0)
+      except Exception:
+        prefetch.shutdown(wait=False, cancel_futures=True)
+        raise
+      page_count += 1
+      if total_found is None:
+        total_found = int(payload.get("numFound", 0) or 0)
+
+      documents = payload.get("documents", [])
+      if not isinstance(documents, list) or len(documents) == 0:
+        break
 
-      consecutive_existing = 0
-      selected_documents += 1
-
-      title = collapse_whitespace(str(document.get("titel", ""))) or f"Vorgang {dip_id}"
-      abstract = collapse_whitespace(str(document.get("abstract", "")))
-      publication_date = normalize_iso_date(str(document.get("datum", "")))
-      work_type = collapse_whitespace(str(document.get("vorgangstyp", ""))) or None
-      descriptors = extract_descriptor_names(document)
-      citations = extract_citation_candidates(document)
-      statute_citation = " | ".join(citations[:4]) if citations else None
-
-      initiative_raw = document.get("initiative")
-      initiative: list[str] = []
-      if isinstance(initiative_raw, list):
-        initiative = [collapse_whitespace(str(item)) for item in initiative_raw if collapse_whitespace(str(item))]
-
-      statute_id = derive_statute_id(title, abstract, descriptors, citations, statute_code_map)
-      text_snippet = build_text_snippet(title, abstract, descriptors, initiative, citations)
-      source_url = f"{args.api_url.rstrip('/')}/{urllib.parse.quote(dip_id)}"
-
-      metadata_payload = {
-        "source": "dip-bundestag",
-        "dip_id": dip_id,
-        "typ": collapse_whitespace(str(document.get("typ", ""))) or None,
-        "wahlperiode": str(document.get("wahlperiode", "")) or None,
-        "vorgangstyp": work_type,
-        "beratungsstand": collapse_whitespace(str(document.get("beratungsstand", ""))) or None,
-        "aktualisiert": collapse_whitespace(str(document.get("aktualisiert", ""))) or None,
-        "initiative": " | ".join(initiative) if initiative else None,
-        "deskriptor": " | ".join(descriptors) if descriptors else None,
-        "query": args.query or None,
-      }
-      metadata_compact = {key: value for key, value in metadata_payload.items() if value not in (None, "")}
-      metadata_json = json.dumps(metadata_compact, ensure_ascii=False)
+      next_cursor = payload.get("cursor")
+      may_continue = (
+        isinstance(next_cursor, str)
+        and bool(next_cursor)
+        and next_cursor != cursor
+        and (args.max_pages is None or args.max_pages < 0 or page_count < args.max_pages)
+      )
+      if may_continue:
+        next_page = prefetch.submit(fetch_page, next_cursor, args.sleep_seconds)
 
-      if args.dry_run:
-        continue
+      for document in documents:
+        if args.max_documents is not None and args.max_documents >= 0 and selected_documents >= args.max_documents:
+          break
+        if not isinstance(document, dict):
+          continue
+
+        dip_id_value = document.get("id")
+        if isinstance(dip_id_value, str):
+          dip_id = collapse_whitespace(dip_id_value)
+        elif isinstance(dip_id_value, int):
+          dip_id = str(dip_id_value)
+        else:
+          dip_id = ""
+        if not dip_id:
+          continue
+
+        already_exists = (
+          existing_bloom is not None
+          and dip_id in existing_bloom
+          and connection.execute(EXISTS_SQL, (dip_id,)).fetchone()
+          is not None
+        )
+        if args.only_missing and already_exists and not args.refresh_existing:
+          skipped_documents += 1
+          consecutive_existing += 1
+          if (
+            args.stop_after_existing is not None
+            and args.stop_after_existing >= 0
+            and consecutive_existing >= args.stop_after_existing
+          ):
+            stop_reason = "consecutive_existing_threshold"
+            break
+          continue
+
+        consecutive_existing = 0
+        selected_documents += 1
+
+        title = clean_str(document.get("titel")) or f"Vorgang {dip_id}"
+        abstract = clean_str(document.get("abstract"))
+        publication_date = normalize_iso_date(clean_str(document.get("datum")))
+        # Work types come from a handful of DIP categories; interning keeps one
+        # shared string per category across hundreds of thousands of rows.
+        work_type = sys.intern(clean_str(document.get("vorgangstyp"))) or None
+        descriptors = extract_descriptor_names(document)
+        citations = extract_citation_candidates(document)
+        statute_citation = " | ".join(citations[:4]) if citations else None
+
+        initiative_raw = document.get("initiative")
+        initiative: list[str] = []
+        if isinstance(initiative_raw, list):
+          for item in initiative_raw:
+            if isinstance(item, str):
+              item = collapse_whitespace(item)
+              if item:
+                initiative.append(item)
+
+        statute_id = derive_statute_id(title, abstract, descriptors, citations, statute_lookup)
+        text_snippet = build_text_snippet(title, abstract, descriptors, initiative, citations)
+        source_url = f"{args.api_url.rstrip('/')}/{urllib.parse.quote(dip_id)}"
+
+        # Build the compact dict directly rather than building a full payload and
+        # filtering it into a second dict per document.
+        metadata: dict[str, str] = {"source": "dip-bundestag", "dip_id": dip_id}
+        typ = clean_str(document.get("typ"))
+        if typ:
+          metadata["typ"] = typ
+        wahlperiode = document.get("wahlperiode")
+        if wahlperiode not in (None, ""):
+          metadata["wahlperiode"] = str(wahlperiode)
+        if work_type:
+          metadata["vorgangstyp"] = work_type
+        beratungsstand = clean_str(document.get("beratungsstand"))
+        if beratungsstand:
+          metadata["beratungsstand"] = beratungsstand
+        aktualisiert = clean_str(document.get("aktualisiert"))
+        if aktualisiert:
+          metadata["aktualisiert"] = aktualisiert
+        if initiative:
+          metadata["initiative"] = " | ".join(initiative)
+        if descriptors:
+          metadata["deskriptor"] = " | ".join(descriptors)
+        if args.query:
+          metadata["query"] = args.query
+        metadata_json = json.dumps(metadata, ensure_ascii=False, separators=(",", ":"))
+
+        if args.dry_run:
+          continue
 
-      try:
         if not args.quiet:
           print(f"[ingest] page={page_count} dip_id={dip_id} title={title[:90]}", file=sys.stderr)
-        upsert_preparatory_work(
-          connection=connection,
+        stage_preparatory_work(
+          pending_rows,
           dip_id=dip_id,
           title=title,
           statute_id=statute_id,
@@ -630,44 +943,64 @@ def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
           text_snippet=text_snippet,
           metadata_json=metadata_json,
         )
-        ingested_documents += 1
+
+      try:
+        ingested_documents += flush_pending_rows(connection, write_cursor, pending_rows)
       except Exception as error:  # noqa: BLE001
-        error_count += 1
-        message = f"{dip_id}: {error}"
+        error_count += len(pending_rows) or 1
+        message = f"page {page_count}: {error}"
         errors.append(message)
+        pending_rows.clear()
         if not args.quiet:
           print(f"[error] {message}", file=sys.stderr)
 
-    next_cursor = payload.get("cursor")
-    if stop_reason:
-      break
-    if not next_cursor or not isinstance(next_cursor, str) or next_cursor == cursor:
-      break
-    cursor = next_cursor
-
-    if args.sleep_seconds > 0:
-      time.sleep(args.sleep_seconds)
-
-  finished_at = now_iso()
-  status = "dry_run" if args.dry_run else "success"
-  if not args.dry_run and error_count > 0 and ingested_documents == 0:
-    status = "failed"
-  elif not args.dry_run and error_count > 0:
-    status = "partial_success"
-
-  finalize_ingestion_run(
-    connection=connection,
-    run_id=run_id,
-    finished_at=finished_at,
-    status=status,
-    total_documents=selected_documents,
-    ingested_documents=ingested_documents,
-    skipped_documents=skipped_documents,
-    error_count=error_count,
-    error_sample=errors,
-  )
-  connection.commit()
-  connection.close()
+      if stop_reason or not may_continue:
+        break
+      cursor = next_cursor
+
+    if next_page is not None:
+      next_page.cancel()
+    prefetch.shutdown(wait=False, cancel_futures=True)
+
+    if bulk_mode:
+      try:
+        end_bulk_fts(connection)
+        bulk_finalized = True
+      except Exception as error:  # noqa: BLE001
+        error_count += 1
+        errors.append(f"fts rebuild: {error}")
+
+    finished_at = now_iso()
+    status = "dry_run" if args.dry_run else "success"
+    if not args.dry_run and error_count > 0 and ingested_documents == 0:
+      status = "failed"
+    elif not args.dry_run and error_count > 0:
+      status = "partial_success"
+
+    finalize_ingestion_run(
+      connection=connection,
+      run_id=run_id,
+      finished_at=finished_at,
+      status=status,
+      total_documents=selected_documents,
+      ingested_documents=ingested_documents,
+      skipped_documents=skipped_documents,
+      error_count=error_count,
+      error_sample=errors,
+    )
+    connection.commit()
+  finally:
+    if bulk_mode and not bulk_finalized:
+      # The run is unwinding with the FTS triggers still dropped; pages
+      # committed so far would otherwise stay missing from the index,
+      # since the conditional upsert never rewrites unchanged documents.
+      # Restore and rebuild first.
+      connection.rollback()
+      try:
+        end_bulk_fts(connection)
+      except sqlite3.Error:
+        pass
+    connection.close()
 
   return {
     "started_at": started_at,
@@ -691,6 +1024,8 @@ def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
 
 def main(argv: list[str]) -> int:
   args = parse_args(argv)
+  if args.server:
+    return run_server()
   try:
     summary = run_ingestion(args)
   except Exception as error:  # noqa: BLE001
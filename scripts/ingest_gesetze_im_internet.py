@@ -10,9 +10,15 @@ Data source:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import datetime as dt
+import gzip
+import hashlib
 import io
 import json
+import multiprocessing
+import os
+import queue
 import re
 import sqlite3
 import sys
@@ -23,26 +29,49 @@ import urllib.parse
 import urllib.request
 import zipfile
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Iterator
 from xml.etree import ElementTree as ET
 
+try:
+  import lxml.etree as LET
+except ImportError:  # lxml is installed in CI; ElementTree remains the fallback
+  LET = None
+
+try:
+  import requests
+except ImportError:  # requests is installed in CI; urllib remains the fallback
+  requests = None
+
 DEFAULT_TOC_URL = "https://www.gesetze-im-internet.de/gii-toc.xml"
 DEFAULT_DB_PATH = "data/database.db"
 DEFAULT_TIMEOUT = 60
 DEFAULT_RETRIES = 3
 DEFAULT_SLEEP_SECONDS = 0.0
+DEFAULT_CONCURRENCY = 8
 USER_AGENT = "ansvar-german-law-mcp/0.1"
 NO_PROXY_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
 
-PROVISION_HINT_PATTERN = re.compile(r"^(§{1,2}|Art\.?|Artikel)\s*", re.IGNORECASE)
-HIERARCHY_LABEL_PATTERN = re.compile(
-    r"^(Inhaltsübersicht|Buch|Teil|Abschnitt|Unterabschnitt|Titel|Untertitel|Kapitel|Anlage)\b",
+# One pooled session shared by the download threads: TLS handshakes are
+# amortized across the ~6k statute fetches instead of paid per request.
+if requests is not None:
+  SESSION = requests.Session()
+  SESSION.trust_env = False
+  _ADAPTER = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+  SESSION.mount("https://", _ADAPTER)
+  SESSION.mount("http://", _ADAPTER)
+else:
+  SESSION = None
+
+# Hierarchy labels and provision markers fused into one anchored alternation:
+# should_index_section enters the regex engine once per norm and reads
+# lastgroup instead of running two separate match calls.
+SECTION_CLASSIFY_PATTERN = re.compile(
+    r"^(?:(?P<hierarchy>Inhaltsübersicht|Buch|Teil|Abschnitt|Unterabschnitt|Titel|Untertitel|Kapitel|Anlage)\b"
+    r"|(?P<provision>§{1,2}|Art\.?|Artikel)\s*)",
     re.IGNORECASE,
 )
-WHITESPACE_PATTERN = re.compile(r"\s+")
 
 SCHEMA_SQL = """
-PRAGMA journal_mode = DELETE;
 PRAGMA foreign_keys = ON;
 
 CREATE TABLE IF NOT EXISTS statutes (
@@ -87,6 +116,34 @@ CREATE VIRTUAL TABLE IF NOT EXISTS law_documents_fts USING fts5(
   tokenize='unicode61'
 );
 
+CREATE TABLE IF NOT EXISTS statute_http_cache (
+  statute_id TEXT PRIMARY KEY,
+  etag TEXT,
+  last_modified TEXT,
+  content_sha256 TEXT,
+  fetched_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS ingestion_runs (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  source_id TEXT NOT NULL,
+  started_at TEXT NOT NULL,
+  finished_at TEXT,
+  status TEXT NOT NULL,
+  total_laws INTEGER NOT NULL DEFAULT 0,
+  ingested_laws INTEGER NOT NULL DEFAULT 0,
+  skipped_laws INTEGER NOT NULL DEFAULT 0,
+  ingested_sections INTEGER NOT NULL DEFAULT 0,
+  skipped_sections INTEGER NOT NULL DEFAULT 0,
+  error_count INTEGER NOT NULL DEFAULT 0,
+  error_sample TEXT,
+  notes TEXT
+);
+"""
+
+# Kept out of SCHEMA_SQL so --fast-load can drop the triggers for the run and
+# rebuild the FTS index in one pass afterwards.
+FTS_TRIGGERS_SQL = """
 CREATE TRIGGER IF NOT EXISTS law_documents_ai
 AFTER INSERT ON law_documents
 BEGIN
@@ -109,22 +166,20 @@ BEGIN
   INSERT INTO law_documents_fts(rowid, title, citation, text_snippet)
   VALUES (new.rowid, new.title, COALESCE(new.citation, ''), COALESCE(new.text_snippet, ''));
 END;
+"""
 
-CREATE TABLE IF NOT EXISTS ingestion_runs (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  source_id TEXT NOT NULL,
-  started_at TEXT NOT NULL,
-  finished_at TEXT,
-  status TEXT NOT NULL,
-  total_laws INTEGER NOT NULL DEFAULT 0,
-  ingested_laws INTEGER NOT NULL DEFAULT 0,
-  skipped_laws INTEGER NOT NULL DEFAULT 0,
-  ingested_sections INTEGER NOT NULL DEFAULT 0,
-  skipped_sections INTEGER NOT NULL DEFAULT 0,
-  error_count INTEGER NOT NULL DEFAULT 0,
-  error_sample TEXT,
-  notes TEXT
-);
+# idx_law_documents_statute stays: the per-statute DELETE depends on it.
+DROP_FAST_LOAD_SQL = """
+DROP TRIGGER IF EXISTS law_documents_ai;
+DROP TRIGGER IF EXISTS law_documents_ad;
+DROP TRIGGER IF EXISTS law_documents_au;
+DROP INDEX IF EXISTS idx_law_documents_citation;
+DROP INDEX IF EXISTS idx_law_documents_country;
+"""
+
+SECONDARY_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_law_documents_citation ON law_documents(citation);
+CREATE INDEX IF NOT EXISTS idx_law_documents_country ON law_documents(country);
 """
 
 
@@ -145,7 +200,14 @@ class ParsedStatute:
   issue_date: str | None
   source_url: str
   xml_url: str
-  rows: list[tuple[str, str, str, str, str, str | None, str, str | None, str, str]]
+  # Flat column values, LAW_DOCUMENT_VALUE_COLUMNS per section: the parse
+  # loop never allocates per-row tuples and the write path slices this list
+  # straight into the multi-row VALUES parameters.
+  row_values: list[str | None]
+
+  @property
+  def section_count(self) -> int:
+    return len(self.row_values) // LAW_DOCUMENT_VALUE_COLUMNS
 
 
 def now_iso() -> str:
@@ -155,13 +217,20 @@ def now_iso() -> str:
 def collapse_whitespace(value: str | None) -> str:
   if not value:
     return ""
-  return WHITESPACE_PATTERN.sub(" ", value).strip()
+  # str.split() splits on the same whitespace class as \s+ but runs in C;
+  # the join also strips leading/trailing runs, so no extra strip is needed.
+  return " ".join(value.split())
+
+
+SLUG_CLEAN_PATTERN = re.compile(r"[^a-zA-Z0-9]+")
 
 
 def normalize_ascii_slug(value: str) -> str:
-  normalized = unicodedata.normalize("NFKD", value)
-  ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
-  cleaned = re.sub(r"[^a-zA-Z0-9]+", "-", ascii_only).strip("-").lower()
+  # NFKD + ASCII re-encode is only needed when the input actually carries
+  # non-ASCII characters; plain refs like "Art 12" skip it entirely.
+  if not value.isascii():
+    value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+  cleaned = SLUG_CLEAN_PATTERN.sub("-", value).strip("-").lower()
   return cleaned or "section"
 
 
@@ -192,51 +261,157 @@ def extract_statute_id(raw_url: str) -> str:
   return path
 
 
+def _is_retryable_http_error(error: Exception) -> bool:
+  if isinstance(error, (urllib.error.URLError, TimeoutError)):
+    return True
+  return requests is not None and isinstance(error, requests.RequestException)
+
+
+def _decode_body(payload: bytes, content_encoding: str | None) -> bytes:
+  """Inflate a gzip response body from the urllib path; requests does this itself."""
+  if content_encoding and content_encoding.lower() == "gzip":
+    return gzip.decompress(payload)
+  return payload
+
+
 def http_get(url: str, timeout: int, retries: int) -> bytes:
-  request = urllib.request.Request(
-    url,
-    headers={
-      "User-Agent": USER_AGENT,
-      "Accept": "*/*",
-    },
-  )
+  # Advertising gzip shrinks the multi-MB TOC transfer several-fold; the
+  # urllib fallback sticks to gzip alone so there is no raw-vs-zlib deflate
+  # ambiguity to handle.
+  headers = {"User-Agent": USER_AGENT, "Accept": "*/*", "Accept-Encoding": "gzip"}
 
   attempt = 0
   while True:
     attempt += 1
     try:
+      if SESSION is not None:
+        # requests decodes Content-Encoding transparently.
+        response = SESSION.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+      request = urllib.request.Request(url, headers=headers)
       with NO_PROXY_OPENER.open(request, timeout=timeout) as response:
-        return response.read()
-    except (urllib.error.URLError, TimeoutError) as error:
+        return _decode_body(response.read(), response.headers.get("Content-Encoding"))
+    except Exception as error:  # noqa: BLE001
+      if not _is_retryable_http_error(error):
+        raise
       if attempt >= retries:
         raise RuntimeError(f"HTTP GET failed after {retries} attempts for {url}: {error}") from error
       time.sleep(min(2**attempt, 8))
 
 
-def parse_toc(xml_payload: bytes) -> list[TocItem]:
-  root = ET.fromstring(xml_payload)
-  items: list[TocItem] = []
+def http_get_conditional(
+  url: str,
+  timeout: int,
+  retries: int,
+  etag: str | None = None,
+  last_modified: str | None = None,
+) -> tuple[bytes | None, str | None, str | None]:
+  """GET with If-None-Match / If-Modified-Since; returns (payload, etag, last_modified).
+
+  A 304 response yields payload None with the cached validators echoed back,
+  so unchanged statutes cost one header round-trip instead of a ZIP download.
+  """
+  headers = {"User-Agent": USER_AGENT, "Accept": "*/*"}
+  if etag:
+    headers["If-None-Match"] = etag
+  if last_modified:
+    headers["If-Modified-Since"] = last_modified
 
-  for item in root.findall("./item"):
-    title = collapse_whitespace(item.findtext("title"))
-    link = collapse_whitespace(item.findtext("link"))
-    if not title or not link:
+  attempt = 0
+  while True:
+    attempt += 1
+    try:
+      if SESSION is not None:
+        response = SESSION.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+          return (None, etag, last_modified)
+        response.raise_for_status()
+        return (response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+      request = urllib.request.Request(url, headers={**headers, "Accept-Encoding": "gzip"})
+      with NO_PROXY_OPENER.open(request, timeout=timeout) as response:
+        payload = _decode_body(response.read(), response.headers.get("Content-Encoding"))
+        return (payload, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    except urllib.error.HTTPError as error:
+      if error.code == 304:
+        return (None, etag, last_modified)
+      if attempt >= retries:
+        raise RuntimeError(f"HTTP GET failed after {retries} attempts for {url}: {error}") from error
+      time.sleep(min(2**attempt, 8))
+    except Exception as error:  # noqa: BLE001
+      if not _is_retryable_http_error(error):
+        raise
+      if attempt >= retries:
+        raise RuntimeError(f"HTTP GET failed after {retries} attempts for {url}: {error}") from error
+      time.sleep(min(2**attempt, 8))
+
+
+def _toc_item_from_element(element: ET.Element) -> TocItem | None:
+  title = collapse_whitespace(element.findtext("title"))
+  link = collapse_whitespace(element.findtext("link"))
+  if not title or not link:
+    return None
+  statute_id = extract_statute_id(link)
+  if not statute_id:
+    return None
+  return TocItem(statute_id=statute_id, title=title, xml_url=normalize_xml_url(link))
+
+
+def parse_toc(xml_payload: bytes) -> Iterator[TocItem]:
+  """Yield TOC entries via iterparse; the multi-MB document never becomes a DOM.
+
+  Each <item> subtree is cleared as soon as its TocItem is built, so peak
+  memory stays at one entry regardless of TOC size.
+  """
+  if LET is not None:
+    for _event, element in LET.iterparse(io.BytesIO(xml_payload), events=("end",), tag="item"):
+      item = _toc_item_from_element(element)
+      element.clear()
+      while element.getprevious() is not None:
+        del element.getparent()[0]
+      if item is not None:
+        yield item
+    return
+
+  root: ET.Element | None = None
+  for event, element in ET.iterparse(io.BytesIO(xml_payload), events=("start", "end")):
+    if event == "start":
+      if root is None:
+        root = element
       continue
-    statute_id = extract_statute_id(link)
-    if not statute_id:
+    if element.tag != "item":
       continue
-    xml_url = normalize_xml_url(link)
-    items.append(TocItem(statute_id=statute_id, title=title, xml_url=xml_url))
-
-  return items
+    item = _toc_item_from_element(element)
+    element.clear()
+    if root is not None:
+      root.clear()
+    if item is not None:
+      yield item
+
+
+# Compiled once: lxml evaluates XPath objects without re-parsing the location
+# path per norm; tried most-specific first, matching the stdlib fallback chain.
+_NORM_TEXT_XPATHS = (
+  (LET.XPath("./textdaten/text/Content"), LET.XPath("./textdaten/text"), LET.XPath("./textdaten"))
+  if LET is not None
+  else None
+)
 
 
 def extract_norm_text(norm: ET.Element) -> str:
-  content_node = norm.find("./textdaten/text/Content")
-  if content_node is None:
-    content_node = norm.find("./textdaten/text")
-  if content_node is None:
-    content_node = norm.find("./textdaten")
+  content_node = None
+  if _NORM_TEXT_XPATHS is not None:
+    for xpath in _NORM_TEXT_XPATHS:
+      nodes = xpath(norm)
+      if nodes:
+        content_node = nodes[0]
+        break
+  else:
+    content_node = norm.find("./textdaten/text/Content")
+    if content_node is None:
+      content_node = norm.find("./textdaten/text")
+    if content_node is None:
+      content_node = norm.find("./textdaten")
   if content_node is None:
     return ""
 
@@ -247,11 +422,16 @@ def extract_norm_text(norm: ET.Element) -> str:
 def should_index_section(section_ref: str, content: str) -> bool:
   if not section_ref:
     return False
-  if HIERARCHY_LABEL_PATTERN.match(section_ref):
+  match = SECTION_CLASSIFY_PATTERN.match(section_ref)
+  if match is not None and match.lastgroup == "hierarchy":
     return False
   if len(content) < 4:
     return False
-  return bool(PROVISION_HINT_PATTERN.match(section_ref) or re.search(r"\d", section_ref))
+  if match is not None:
+    return True
+  # Refs without a provision marker still index when they carry a number
+  # ("1. DV" etc.); char scan beats a regex search on these short strings.
+  return any(char.isdigit() for char in section_ref)
 
 
 def make_source_url(statute_id: str) -> str:
@@ -289,32 +469,77 @@ def dedupe_section_ref(section_ref: str, seen_section_refs: dict[str, int]) -> s
   return f"{section_ref} [{count}]"
 
 
-def parse_statute_package(item: TocItem, zip_payload: bytes) -> ParsedStatute:
-  with zipfile.ZipFile(io.BytesIO(zip_payload), "r") as archive:
-    xml_members = [name for name in archive.namelist() if name.lower().endswith(".xml")]
-    if not xml_members:
-      raise RuntimeError(f"No XML file found in archive for {item.statute_id}")
-    xml_payload = archive.read(xml_members[0])
-
-  root = ET.fromstring(xml_payload)
-  norms = root.findall("./norm")
-  if not norms:
-    raise RuntimeError(f"No <norm> entries found for {item.statute_id}")
+def iter_norms(xml_stream) -> Iterator[ET.Element]:
+  """Yield each <norm> element from a binary stream, via lxml when available.
+
+  lxml parses in C and the eager clear keeps peak memory flat even for the
+  largest statutes; consumers must finish with an element before advancing.
+  """
+  if LET is not None:
+    for _event, element in LET.iterparse(xml_stream, events=("end",), tag="norm"):
+      yield element
+      element.clear()
+      while element.getprevious() is not None:
+        del element.getparent()[0]
+  else:
+    yield from ET.parse(xml_stream).getroot().iter("norm")
+
+
+def iter_package_norms(archive: zipfile.ZipFile, member: str) -> Iterator[ET.Element]:
+  """Stream norms straight out of the open archive member.
 
-  main_meta = norms[0].find("metadaten")
-  jurabk = text_of(main_meta, "jurabk")
-  amtabk = text_of(main_meta, "amtabk")
-  full_title = text_of(main_meta, "langue")
-  issue_date = text_of(main_meta, "ausfertigung-datum")
+  The decompressed XML is never materialized as one bytes object; zipfile
+  inflates on demand while the parser consumes the stream.
+  """
+  with archive, archive.open(member) as xml_stream:
+    yield from iter_norms(xml_stream)
+
+
+def parse_statute_package(item: TocItem, zip_payload: bytes) -> ParsedStatute:
+  archive = zipfile.ZipFile(io.BytesIO(zip_payload), "r")
+  xml_members = [name for name in archive.namelist() if name.lower().endswith(".xml")]
+  if not xml_members:
+    archive.close()
+    raise RuntimeError(f"No XML file found in archive for {item.statute_id}")
+
+  jurabk: str | None = None
+  amtabk: str | None = None
+  full_title: str | None = None
+  issue_date: str | None = None
   source_url = make_source_url(item.statute_id)
-  base_title = full_title or item.title
+  base_title = item.title
+  citation_code = item.statute_id.upper()
+  metadata_base: dict[str, str] = {
+    "source": "gesetze-im-internet",
+    "statute_id": item.statute_id,
+    "toc_title": item.title,
+    "xml_url": item.xml_url,
+  }
 
-  rows: list[tuple[str, str, str, str, str, str | None, str, str | None, str, str]] = []
+  row_values: list[str | None] = []
   seen_ids: set[str] = set()
   seen_section_refs: dict[str, int] = {}
+  norm_count = 0
+  metadata_base_json: str | None = None
 
-  for norm in norms:
+  for norm in iter_package_norms(archive, xml_members[0]):
     metadata = norm.find("metadaten")
+    norm_count += 1
+    if norm_count == 1:
+      # The first norm carries the statute-level metadata; everything derived
+      # from it is invariant for the rest of the loop.
+      jurabk = text_of(metadata, "jurabk")
+      amtabk = text_of(metadata, "amtabk")
+      full_title = text_of(metadata, "langue")
+      issue_date = text_of(metadata, "ausfertigung-datum")
+      base_title = full_title or item.title
+      citation_code = jurabk or amtabk or item.statute_id.upper()
+      if jurabk:
+        metadata_base["jurabk"] = jurabk
+      if amtabk:
+        metadata_base["amtabk"] = amtabk
+      if full_title:
+        metadata_base["full_title"] = full_title
     if metadata is None:
       continue
 
@@ -328,26 +553,24 @@ def parse_statute_package(item: TocItem, zip_payload: bytes) -> ParsedStatute:
 
     section_ref_for_db = dedupe_section_ref(section_ref, seen_section_refs)
     document_id = make_document_id(item.statute_id, section_ref, seen_ids, norm_doknr or None)
-    citation_code = jurabk or amtabk or item.statute_id.upper()
     citation = collapse_whitespace(f"{section_ref} {citation_code}")
     title_suffix = section_title or section_ref
     row_title = collapse_whitespace(f"{base_title} - {title_suffix}")
 
-    metadata_payload = {
-      "source": "gesetze-im-internet",
-      "statute_id": item.statute_id,
-      "jurabk": jurabk,
-      "amtabk": amtabk,
-      "full_title": full_title,
-      "toc_title": item.title,
-      "section_ref": section_ref,
-      "section_title": section_title or None,
-      "norm_doknr": norm_doknr or None,
-      "xml_url": item.xml_url,
-    }
-    metadata_compact = {key: value for key, value in metadata_payload.items() if value is not None and value != ""}
-
-    rows.append(
+    # The statute-level keys are serialized once (after the first norm fixed
+    # them) and the per-section delta is spliced on; the resulting text is
+    # byte-identical to dumping the merged dict but skips re-encoding the
+    # invariant fields for every section.
+    if metadata_base_json is None:
+      metadata_base_json = json.dumps(metadata_base, ensure_ascii=False)[:-1]
+    metadata_delta = {"section_ref": section_ref}
+    if section_title:
+      metadata_delta["section_title"] = section_title
+    if norm_doknr:
+      metadata_delta["norm_doknr"] = norm_doknr
+    metadata_json = metadata_base_json + ", " + json.dumps(metadata_delta, ensure_ascii=False)[1:]
+
+    row_values.extend(
       (
         document_id,
         "de",
@@ -359,10 +582,13 @@ def parse_statute_package(item: TocItem, zip_payload: bytes) -> ParsedStatute:
         source_url,
         issue_date or None,
         text_body,
-        json.dumps(metadata_compact, ensure_ascii=False),
+        metadata_json,
       )
     )
 
+  if norm_count == 0:
+    raise RuntimeError(f"No <norm> entries found for {item.statute_id}")
+
   return ParsedStatute(
     statute_id=item.statute_id,
     title=item.title,
@@ -372,12 +598,50 @@ def parse_statute_package(item: TocItem, zip_payload: bytes) -> ParsedStatute:
     issue_date=issue_date,
     source_url=source_url,
     xml_url=item.xml_url,
-    rows=rows,
+    row_values=row_values,
   )
 
 
+def configure_connection(connection: sqlite3.Connection, journal_mode: str = "wal") -> None:
+  """Tune the connection for bulk ingestion.
+
+  WAL with synchronous=NORMAL collapses per-commit fsyncs and lets readers
+  (the MCP server) keep querying while an ingest is running; --journal-mode
+  delete restores the old rollback-journal behaviour.
+  """
+  connection.execute(f"PRAGMA journal_mode = {journal_mode.upper()}")
+  connection.execute("PRAGMA synchronous = NORMAL")
+  connection.execute("PRAGMA temp_store = MEMORY")
+  connection.execute("PRAGMA cache_size = -262144")
+  connection.execute("PRAGMA mmap_size = 268435456")
+  connection.execute("PRAGMA wal_autocheckpoint = 10000")
+  connection.execute("PRAGMA busy_timeout = 30000")
+
+
+def close_connection(connection: sqlite3.Connection) -> None:
+  try:
+    connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+  except sqlite3.Error:
+    pass
+  connection.close()
+
+
 def ensure_schema(connection: sqlite3.Connection) -> None:
   connection.executescript(SCHEMA_SQL)
+  connection.executescript(FTS_TRIGGERS_SQL)
+
+
+def begin_fast_load(connection: sqlite3.Connection) -> None:
+  """Drop FTS triggers and secondary indexes so bulk inserts skip per-row maintenance."""
+  connection.executescript(DROP_FAST_LOAD_SQL)
+
+
+def end_fast_load(connection: sqlite3.Connection) -> None:
+  """Recreate the dropped indexes, rebuild FTS from content, restore triggers."""
+  connection.executescript(SECONDARY_INDEXES_SQL)
+  connection.execute("INSERT INTO law_documents_fts(law_documents_fts) VALUES('rebuild')")
+  connection.executescript(FTS_TRIGGERS_SQL)
+  connection.commit()
 
 
 def insert_ingestion_run_start(connection: sqlite3.Connection, source_id: str, started_at: str, total_laws: int) -> int:
@@ -434,83 +698,141 @@ def finalize_ingestion_run(
   )
 
 
-def statute_exists(connection: sqlite3.Connection, statute_id: str) -> tuple[bool, int]:
-  row = connection.execute(
-    "SELECT section_count FROM statutes WHERE statute_id = ? LIMIT 1",
-    (statute_id,),
-  ).fetchone()
-  if not row:
-    return (False, 0)
-  return (True, int(row[0] or 0))
+def fetch_statute_section_counts(connection: sqlite3.Connection) -> dict[str, int]:
+  """One bulk SELECT replacing the former per-statute existence checks.
 
+  The dict doubles as the existence test and the section-count lookup, so
+  the ingestion loop never goes back to the database for bookkeeping.
+  """
+  rows = connection.execute("SELECT statute_id, section_count FROM statutes").fetchall()
+  return {str(row[0]): int(row[1] or 0) for row in rows}
 
-def upsert_statute_and_rows(connection: sqlite3.Connection, statute: ParsedStatute) -> tuple[int, int]:
-  existing_count_row = connection.execute(
-    "SELECT COUNT(*) FROM law_documents WHERE statute_id = ?",
-    (statute.statute_id,),
-  ).fetchone()
-  existing_count = int(existing_count_row[0]) if existing_count_row else 0
 
-  now = now_iso()
-  with connection:
-    connection.execute("DELETE FROM law_documents WHERE statute_id = ?", (statute.statute_id,))
-    connection.execute(
-      """
-      INSERT INTO statutes (
-        statute_id, title, jurabk, amtabk, full_title, issue_date, source_url, xml_url, section_count, updated_at
+# Per-row bound values; updated_at is shared across the whole chunk and bound
+# once as the final numbered parameter.
+LAW_DOCUMENT_VALUE_COLUMNS = 11
+# Multi-row VALUES lists must stay under SQLite's host-parameter cap (32766
+# since 3.32, 999 before that); one slot is reserved for the shared stamp.
+MAX_ROWS_PER_INSERT = ((32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999) - 1) // LAW_DOCUMENT_VALUE_COLUMNS
+
+# Removes only the sections that disappeared from a statute; surviving rows
+# are handled in place by the conditional ON CONFLICT UPDATE, so the FTS
+# delete/insert trigger pair no longer fires for every unchanged section.
+STALE_ROWS_DELETE_SQL = (
+  "DELETE FROM law_documents WHERE statute_id = ? AND id NOT IN (SELECT value FROM json_each(?))"
+)
+
+_INSERT_SQL_CACHE: dict[int, str] = {}
+
+
+def law_documents_insert_sql(row_count: int) -> str:
+  """Build (and cache per row count) a multi-row upsert for law_documents.
+
+  One VALUES list per chunk executes a single VDBE program instead of one
+  statement step per row; full statutes reuse the MAX_ROWS_PER_INSERT
+  statement and only the remainder compiles a second shape. Row i binds the
+  numbered parameters i*11+1 .. i*11+11; the last parameter carries the
+  updated_at stamp reused by every row.
+  """
+  sql = _INSERT_SQL_CACHE.get(row_count)
+  if sql is None:
+    stamp_param = row_count * LAW_DOCUMENT_VALUE_COLUMNS + 1
+    values = ",".join(
+      "("
+      + ",".join(f"?{row * LAW_DOCUMENT_VALUE_COLUMNS + column}" for column in range(1, LAW_DOCUMENT_VALUE_COLUMNS + 1))
+      + f",?{stamp_param})"
+      for row in range(row_count)
+    )
+    sql = f"""
+      INSERT INTO law_documents (
+        id, country, statute_id, section_ref, kind, title, citation, source_url, effective_date, text_snippet, metadata_json, updated_at
       )
-      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-      ON CONFLICT(statute_id) DO UPDATE SET
+      VALUES {values}
+      ON CONFLICT(id) DO UPDATE SET
+        country = excluded.country,
+        statute_id = excluded.statute_id,
+        section_ref = excluded.section_ref,
+        kind = excluded.kind,
         title = excluded.title,
-        jurabk = excluded.jurabk,
-        amtabk = excluded.amtabk,
-        full_title = excluded.full_title,
-        issue_date = excluded.issue_date,
+        citation = excluded.citation,
         source_url = excluded.source_url,
-        xml_url = excluded.xml_url,
-        section_count = excluded.section_count,
+        effective_date = excluded.effective_date,
+        text_snippet = excluded.text_snippet,
+        metadata_json = excluded.metadata_json,
         updated_at = excluded.updated_at
-      """,
-      (
-        statute.statute_id,
-        statute.title,
-        statute.jurabk,
-        statute.amtabk,
-        statute.full_title,
-        statute.issue_date,
-        statute.source_url,
-        statute.xml_url,
-        len(statute.rows),
-        now,
-      ),
+      WHERE excluded.country IS NOT law_documents.country
+        OR excluded.statute_id IS NOT law_documents.statute_id
+        OR excluded.section_ref IS NOT law_documents.section_ref
+        OR excluded.kind IS NOT law_documents.kind
+        OR excluded.title IS NOT law_documents.title
+        OR excluded.citation IS NOT law_documents.citation
+        OR excluded.source_url IS NOT law_documents.source_url
+        OR excluded.effective_date IS NOT law_documents.effective_date
+        OR excluded.text_snippet IS NOT law_documents.text_snippet
+        OR excluded.metadata_json IS NOT law_documents.metadata_json
+      """
+    _INSERT_SQL_CACHE[row_count] = sql
+  return sql
+
+
+def upsert_statute_and_rows(connection: sqlite3.Connection, statute: ParsedStatute, existing_count: int = 0) -> tuple[int, int]:
+  """Write one statute and its sections; the caller owns the transaction.
+
+  No commit happens here: run_ingestion batches many statutes into one
+  explicit transaction so the fsync cost is paid per batch, not per law.
+  existing_count comes from the prefetched section-count map, replacing the
+  COUNT(*) round-trip that used to run per statute.
+  """
+  now = now_iso()
+  section_count = statute.section_count
+  if section_count:
+    # Stale rows go first so a vanished section cannot collide with a new
+    # row on the (statute_id, section_ref) unique constraint.
+    document_ids = statute.row_values[0 :: LAW_DOCUMENT_VALUE_COLUMNS]
+    connection.execute(STALE_ROWS_DELETE_SQL, (statute.statute_id, json.dumps(document_ids)))
+  else:
+    connection.execute("DELETE FROM law_documents WHERE statute_id = ?", (statute.statute_id,))
+  connection.execute(
+    """
+    INSERT INTO statutes (
+      statute_id, title, jurabk, amtabk, full_title, issue_date, source_url, xml_url, section_count, updated_at
     )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(statute_id) DO UPDATE SET
+      title = excluded.title,
+      jurabk = excluded.jurabk,
+      amtabk = excluded.amtabk,
+      full_title = excluded.full_title,
+      issue_date = excluded.issue_date,
+      source_url = excluded.source_url,
+      xml_url = excluded.xml_url,
+      section_count = excluded.section_count,
+      updated_at = excluded.updated_at
+    """,
+    (
+      statute.statute_id,
+      statute.title,
+      statute.jurabk,
+      statute.amtabk,
+      statute.full_title,
+      statute.issue_date,
+      statute.source_url,
+      statute.xml_url,
+      section_count,
+      now,
+    ),
+  )
 
-    if statute.rows:
-      connection.executemany(
-        """
-        INSERT INTO law_documents (
-          id, country, statute_id, section_ref, kind, title, citation, source_url, effective_date, text_snippet, metadata_json, updated_at
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(id) DO UPDATE SET
-          country = excluded.country,
-          statute_id = excluded.statute_id,
-          section_ref = excluded.section_ref,
-          kind = excluded.kind,
-          title = excluded.title,
-          citation = excluded.citation,
-          source_url = excluded.source_url,
-          effective_date = excluded.effective_date,
-          text_snippet = excluded.text_snippet,
-          metadata_json = excluded.metadata_json,
-          updated_at = excluded.updated_at
-        """,
-        [(*row, now) for row in statute.rows],
-      )
+  if statute.row_values:
+    values = statute.row_values
+    for start in range(0, section_count, MAX_ROWS_PER_INSERT):
+      chunk_rows = min(MAX_ROWS_PER_INSERT, section_count - start)
+      params = values[start * LAW_DOCUMENT_VALUE_COLUMNS : (start + chunk_rows) * LAW_DOCUMENT_VALUE_COLUMNS]
+      params.append(now)
+      connection.execute(law_documents_insert_sql(chunk_rows), params)
 
-  ingested_sections = len(statute.rows)
-  skipped_sections = max(existing_count - ingested_sections, 0)
-  return (ingested_sections, skipped_sections)
+  skipped_sections = max(existing_count - section_count, 0)
+  return (section_count, skipped_sections)
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -523,15 +845,71 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
   parser.add_argument("--title-contains", default=None, help="Only ingest statutes whose title contains this string")
   parser.add_argument("--only-missing", action="store_true", help="Only ingest statutes that are not yet present in table statutes")
   parser.add_argument("--refresh-existing", action="store_true", help="Re-ingest statutes already present in the database")
-  parser.add_argument("--sleep-seconds", type=float, default=DEFAULT_SLEEP_SECONDS, help="Pause between statute downloads")
+  parser.add_argument("--sleep-seconds", type=float, default=DEFAULT_SLEEP_SECONDS, help="Per-worker pause before each statute download")
+  parser.add_argument(
+    "--commit-every",
+    type=int,
+    default=50,
+    help="Commit the write transaction after this many statutes (default: 50)",
+  )
+  parser.add_argument(
+    "--concurrency",
+    type=int,
+    default=DEFAULT_CONCURRENCY,
+    help=f"Number of parallel download/parse workers (default: {DEFAULT_CONCURRENCY})",
+  )
   parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help=f"HTTP timeout in seconds (default: {DEFAULT_TIMEOUT})")
   parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help=f"HTTP retries (default: {DEFAULT_RETRIES})")
+  parser.add_argument(
+    "--parse-processes",
+    type=int,
+    default=None,
+    help="Worker processes for ZIP/XML parsing (default: CPU count; 0 parses on the download threads)",
+  )
+  parser.add_argument(
+    "--fast-load",
+    action="store_true",
+    help="Drop FTS triggers and secondary indexes for the run, rebuild once at the end (for full ingests)",
+  )
+  parser.add_argument(
+    "--journal-mode",
+    choices=["wal", "delete"],
+    default="wal",
+    help="SQLite journal mode for the ingest connection (default: wal)",
+  )
   parser.add_argument("--quiet", action="store_true", help="Suppress per-statute progress logs")
   parser.add_argument("--dry-run", action="store_true", help="Resolve and report ingestion scope only")
   parser.add_argument("--report-path", default=None, help="Optional path to write summary JSON")
+  parser.add_argument(
+    "--server",
+    action="store_true",
+    help="Worker mode: read one JSON argv array per stdin line, write one JSON report per stdout line",
+  )
   return parser.parse_args(argv)
 
 
+def run_server() -> int:
+  """Serve ingestion commands over stdin so the orchestrator can keep one
+  resident worker per source instead of paying interpreter startup per cycle."""
+  for line in sys.stdin:
+    command = line.strip()
+    if not command:
+      continue
+    try:
+      command_args = parse_args([str(item) for item in json.loads(command)])
+      summary = run_ingestion(command_args)
+    except (Exception, SystemExit) as error:  # noqa: BLE001
+      summary = {
+        "started_at": now_iso(),
+        "finished_at": now_iso(),
+        "status": "failed",
+        "source_id": "gesetze-im-internet",
+        "error": str(error),
+      }
+    print(json.dumps(summary, ensure_ascii=False), flush=True)
+  return 0
+
+
 def filter_items(items: Iterable[TocItem], args: argparse.Namespace) -> list[TocItem]:
   filtered = list(items)
 
@@ -557,10 +935,76 @@ def fetch_existing_statute_ids(connection: sqlite3.Connection) -> set[str]:
   return {str(row[0]) for row in rows}
 
 
+def fetch_http_cache(connection: sqlite3.Connection) -> dict[str, tuple[str | None, str | None, str | None]]:
+  rows = connection.execute("SELECT statute_id, etag, last_modified, content_sha256 FROM statute_http_cache").fetchall()
+  return {str(row[0]): (row[1], row[2], row[3]) for row in rows}
+
+
+def upsert_http_cache(
+  connection: sqlite3.Connection,
+  statute_id: str,
+  etag: str | None,
+  last_modified: str | None,
+  content_sha256: str | None,
+) -> None:
+  connection.execute(
+    """
+    INSERT INTO statute_http_cache (statute_id, etag, last_modified, content_sha256, fetched_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(statute_id) DO UPDATE SET
+      etag = excluded.etag,
+      last_modified = excluded.last_modified,
+      content_sha256 = excluded.content_sha256,
+      fetched_at = excluded.fetched_at
+    """,
+    (statute_id, etag, last_modified, content_sha256, now_iso()),
+  )
+
+
+def fetch_and_parse(
+  item: TocItem,
+  args: argparse.Namespace,
+  parse_pool: concurrent.futures.ProcessPoolExecutor | None = None,
+  cached: tuple[str | None, str | None, str | None] | None = None,
+) -> tuple[ParsedStatute | None, str | None, str | None, str | None]:
+  """Download and parse one statute package; runs on a pool worker thread.
+
+  Returns (parsed, etag, last_modified, sha256); parsed is None when the
+  server answered 304 or the payload hash matches the cached one, meaning
+  nothing changed. With a parse pool, inflate + XML parse run in a worker
+  process so the CPU-heavy phase scales across cores instead of contending
+  on the GIL; the calling thread blocks on the result, which bounds
+  in-flight parse jobs to the download concurrency.
+  """
+  if args.sleep_seconds > 0:
+    time.sleep(args.sleep_seconds)
+  etag, last_modified, cached_sha = cached if cached else (None, None, None)
+  zip_payload, new_etag, new_last_modified = http_get_conditional(
+    item.xml_url,
+    timeout=args.timeout,
+    retries=args.retries,
+    etag=etag,
+    last_modified=last_modified,
+  )
+  if zip_payload is None:
+    return (None, etag, last_modified, cached_sha)
+  digest = hashlib.sha256(zip_payload).hexdigest()
+  if cached_sha is not None and digest == cached_sha:
+    # Server ignored the conditional headers but the bytes are identical.
+    return (None, new_etag, new_last_modified, digest)
+  if parse_pool is not None:
+    parsed = parse_pool.submit(parse_statute_package, item, zip_payload).result()
+  else:
+    parsed = parse_statute_package(item, zip_payload)
+  return (parsed, new_etag, new_last_modified, digest)
+
+
 def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
   started_at = now_iso()
   toc_payload = http_get(args.toc_url, timeout=args.timeout, retries=args.retries)
-  toc_items = parse_toc(toc_payload)
+  # The item list itself is small; only the XML DOM was the memory hog, and
+  # parse_toc streams that away. The list is kept for len() in the summary.
+  toc_items = list(parse_toc(toc_payload))
   selected_items = filter_items(toc_items, args)
 
   if args.dry_run:
@@ -592,46 +1036,64 @@ def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
       summary["missing_statutes"] = missing_count
     return summary
 
-  connection = sqlite3.connect(args.db_path)
-  connection.row_factory = sqlite3.Row
+  # 512 cached statements keeps every insert/upsert shape compiled for the
+  # whole run; the default 128 can evict the multi-row VALUES variants.
+  connection = sqlite3.connect(args.db_path, cached_statements=512)
+  configure_connection(connection, args.journal_mode)
   ensure_schema(connection)
-  if args.only_missing:
-    existing_ids = fetch_existing_statute_ids(connection)
-    selected_items = [item for item in selected_items if item.statute_id not in existing_ids]
-    if args.max_laws is not None and args.max_laws >= 0:
-      selected_items = selected_items[: args.max_laws]
-  else:
-    existing_ids = set()
-  connection.execute(
-    """
-    UPDATE ingestion_runs
-    SET status = 'interrupted',
-        finished_at = COALESCE(finished_at, ?),
-        notes = COALESCE(notes, 'Run was interrupted before finalization.')
-    WHERE status = 'running'
-    """,
-    (now_iso(),),
-  )
-  connection.commit()
-
-  run_id = insert_ingestion_run_start(
-    connection=connection,
-    source_id="gesetze-im-internet",
-    started_at=started_at,
-    total_laws=len(selected_items),
-  )
-
-  ingested_laws = 0
-  skipped_laws = 0
-  ingested_sections = 0
-  skipped_sections = 0
-  error_count = 0
-  errors: list[str] = []
-
-  for index, item in enumerate(selected_items, start=1):
+  if args.fast_load:
+    begin_fast_load(connection)
+  fast_load_finalized = False
+  try:
+    # Bookkeeping SELECTs run on a dedicated read-only connection so they never
+    # share the writer's lock state; with WAL this is the same arrangement that
+    # lets the MCP server keep serving queries while an ingest is running.
+    reader = sqlite3.connect(f"file:{args.db_path}?mode=ro", uri=True)
     try:
-      exists, existing_sections = statute_exists(connection, item.statute_id)
-      if exists and not args.refresh_existing:
+      section_counts = fetch_statute_section_counts(reader)
+      http_cache = fetch_http_cache(reader)
+    finally:
+      reader.close()
+    if args.only_missing:
+      existing_ids = set(section_counts)
+      selected_items = [item for item in selected_items if item.statute_id not in existing_ids]
+      if args.max_laws is not None and args.max_laws >= 0:
+        selected_items = selected_items[: args.max_laws]
+    else:
+      existing_ids = set()
+    connection.execute(
+      """
+      UPDATE ingestion_runs
+      SET status = 'interrupted',
+          finished_at = COALESCE(finished_at, ?),
+          notes = COALESCE(notes, 'Run was interrupted before finalization.')
+      WHERE status = 'running'
+      """,
+      (now_iso(),),
+    )
+    connection.commit()
+
+    run_id = insert_ingestion_run_start(
+      connection=connection,
+      source_id="gesetze-im-internet",
+      started_at=started_at,
+      total_laws=len(selected_items),
+    )
+    # Commit the run row on its own so progress is durable and the batched
+    # write transaction below starts from a clean state.
+    connection.commit()
+
+    ingested_laws = 0
+    skipped_laws = 0
+    ingested_sections = 0
+    skipped_sections = 0
+    error_count = 0
+    errors: list[str] = []
+
+    pending_items: list[TocItem] = []
+    for index, item in enumerate(selected_items, start=1):
+      existing_sections = section_counts.get(item.statute_id)
+      if existing_sections is not None and not args.refresh_existing:
         skipped_laws += 1
         skipped_sections += existing_sections
         if not args.quiet:
@@ -641,50 +1103,205 @@ def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
             file=sys.stderr,
           )
         continue
-
-      if not args.quiet:
-        print(
-          f"[ingest] {index}/{len(selected_items)} {item.statute_id} :: {item.title}",
-          file=sys.stderr,
-        )
-      zip_payload = http_get(item.xml_url, timeout=args.timeout, retries=args.retries)
-      parsed_statute = parse_statute_package(item, zip_payload)
-      inserted_sections, removed_sections = upsert_statute_and_rows(connection, parsed_statute)
-
-      ingested_laws += 1
-      ingested_sections += inserted_sections
-      skipped_sections += removed_sections
-
-      if args.sleep_seconds > 0:
-        time.sleep(args.sleep_seconds)
-    except Exception as error:  # noqa: BLE001
-      error_count += 1
-      message = f"{item.statute_id}: {error}"
-      errors.append(message)
-      if not args.quiet:
-        print(f"[error] {message}", file=sys.stderr)
-
-  finished_at = now_iso()
-  status = "success"
-  if error_count > 0 and ingested_laws == 0:
-    status = "failed"
-  elif error_count > 0:
-    status = "partial_success"
-
-  finalize_ingestion_run(
-    connection=connection,
-    run_id=run_id,
-    finished_at=finished_at,
-    status=status,
-    ingested_laws=ingested_laws,
-    skipped_laws=skipped_laws,
-    ingested_sections=ingested_sections,
-    skipped_sections=skipped_sections,
-    error_count=error_count,
-    error_sample=errors,
-  )
-  connection.commit()
-  connection.close()
+      pending_items.append(item)
+
+    # Workers overlap download and XML parsing; the SQLite connection stays on
+    # this thread, so writes remain serialized through the completion loop.
+    parse_workers = (os.cpu_count() or 1) if args.parse_processes is None else args.parse_processes
+    # Spinning up worker processes is not worth it for a handful of statutes.
+    # The pool spawns its workers lazily at the first submit, which happens on
+    # a download thread; forkserver avoids os.fork() of an already-threaded
+    # process (deadlock-prone, and a DeprecationWarning on 3.12+).
+    parse_pool = (
+      concurrent.futures.ProcessPoolExecutor(
+        max_workers=parse_workers,
+        mp_context=multiprocessing.get_context("forkserver" if sys.platform != "win32" else "spawn"),
+      )
+      if parse_workers > 0 and len(pending_items) >= 4
+      else None
+    )
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.concurrency))
+    # Bounded hand-off between the fetch/parse workers and the single writer:
+    # the writer always has the next parsed statute ready, while the maxsize
+    # caps how many parsed-but-unwritten statutes can pile up in memory when
+    # the network outruns the disk.
+    results: queue.Queue = queue.Queue(maxsize=max(1, args.concurrency) * 2)
+
+    def produce(item: TocItem, cached: tuple[str | None, str | None, str | None] | None) -> None:
+      try:
+        results.put((item, fetch_and_parse(item, args, parse_pool, cached), None))
+      except BaseException as error:  # noqa: BLE001
+        results.put((item, None, error))
+
+    for item in pending_items:
+      executor.submit(produce, item, http_cache.get(item.statute_id))
+    commit_every = max(1, args.commit_every)
+    batch_count = 0
+    # The write transaction opens lazily, right before the first write of a
+    # batch, so the WAL write lock is never held while this thread is blocked
+    # on the queue.
+    in_txn = False
+    # Per-batch deltas: a rollback discards the batch's rows, so the run
+    # totals and the section-count map have to be wound back with it.
+    batch_laws = 0
+    batch_sections = 0
+    batch_removed = 0
+    batch_prev_counts: dict[str, int | None] = {}
+    try:
+      for completed in range(1, len(pending_items) + 1):
+        if in_txn and results.empty():
+          # Downloads are pacing the loop; release the write lock instead of
+          # holding it across the wait so sibling WAL writers can commit.
+          connection.commit()
+          in_txn = False
+          batch_count = 0
+          batch_laws = batch_sections = batch_removed = 0
+          batch_prev_counts.clear()
+        item, payload, fetch_error = results.get()
+        if fetch_error is not None:
+          # Download/parse failures never touched the database; any open batch
+          # stays valid.
+          error_count += 1
+          message = f"{item.statute_id}: {fetch_error}"
+          errors.append(message)
+          if not args.quiet:
+            print(f"[error] {message}", file=sys.stderr)
+          continue
+        parsed_statute, etag, last_modified, content_sha = payload
+
+        if parsed_statute is None:
+          skipped_laws += 1
+          if not in_txn:
+            connection.execute("BEGIN IMMEDIATE")
+            in_txn = True
+          upsert_http_cache(connection, item.statute_id, etag, last_modified, content_sha)
+          if not args.quiet:
+            print(
+              f"[unchanged] {completed}/{len(pending_items)} {item.statute_id} (not modified)",
+              file=sys.stderr,
+            )
+          continue
+
+        try:
+          if not in_txn:
+            connection.execute("BEGIN IMMEDIATE")
+            in_txn = True
+          inserted_sections, removed_sections = upsert_statute_and_rows(
+            connection, parsed_statute, section_counts.get(item.statute_id, 0)
+          )
+          upsert_http_cache(connection, item.statute_id, etag, last_modified, content_sha)
+        except Exception as error:  # noqa: BLE001
+          # A write failure poisons the current batch: roll it back and let the
+          # next write open a fresh transaction. The rows counted for this
+          # batch were just discarded, so the run totals and section_counts
+          # go back with them.
+          connection.rollback()
+          in_txn = False
+          batch_count = 0
+          ingested_laws -= batch_laws
+          ingested_sections -= batch_sections
+          skipped_sections -= batch_removed
+          for statute_id, previous in batch_prev_counts.items():
+            if previous is None:
+              section_counts.pop(statute_id, None)
+            else:
+              section_counts[statute_id] = previous
+          batch_laws = batch_sections = batch_removed = 0
+          batch_prev_counts.clear()
+          error_count += 1
+          message = f"{item.statute_id}: {error}"
+          errors.append(message)
+          if not args.quiet:
+            print(f"[error] {message}", file=sys.stderr)
+          continue
+
+        ingested_laws += 1
+        ingested_sections += inserted_sections
+        skipped_sections += removed_sections
+        batch_laws += 1
+        batch_sections += inserted_sections
+        batch_removed += removed_sections
+        if item.statute_id not in batch_prev_counts:
+          batch_prev_counts[item.statute_id] = section_counts.get(item.statute_id)
+        section_counts[item.statute_id] = inserted_sections
+        batch_count += 1
+        if batch_count >= commit_every:
+          connection.commit()
+          in_txn = False
+          batch_count = 0
+          batch_laws = batch_sections = batch_removed = 0
+          batch_prev_counts.clear()
+        if not args.quiet:
+          print(
+            f"[ingest] {completed}/{len(pending_items)} {item.statute_id} :: {item.title}",
+            file=sys.stderr,
+          )
+    except BaseException:
+      # Any unwind — not just Ctrl-C, but also a sqlite3.Error escaping a
+      # BEGIN, a batch-boundary commit, or the unchanged-path cache upsert —
+      # must drain the queue, or producers stuck in results.put() keep the
+      # process alive after the failure is reported.
+      if in_txn:
+        connection.rollback()
+        in_txn = False
+      executor.shutdown(wait=False, cancel_futures=True)
+      # Unblock producers stuck on a full queue; with maxsize at twice the
+      # worker count, one drain leaves room for every in-flight put.
+      while True:
+        try:
+          results.get_nowait()
+        except queue.Empty:
+          break
+      if parse_pool is not None:
+        parse_pool.shutdown(wait=False, cancel_futures=True)
+      raise
+    executor.shutdown(wait=True)
+    if parse_pool is not None:
+      parse_pool.shutdown(wait=True)
+    if in_txn:
+      connection.commit()
+      in_txn = False
+
+    if args.fast_load:
+      try:
+        end_fast_load(connection)
+        fast_load_finalized = True
+      except Exception as error:  # noqa: BLE001
+        error_count += 1
+        errors.append(f"fast-load finalize: {error}")
+
+    finished_at = now_iso()
+    status = "success"
+    if error_count > 0 and ingested_laws == 0:
+      status = "failed"
+    elif error_count > 0:
+      status = "partial_success"
+
+    finalize_ingestion_run(
+      connection=connection,
+      run_id=run_id,
+      finished_at=finished_at,
+      status=status,
+      ingested_laws=ingested_laws,
+      skipped_laws=skipped_laws,
+      ingested_sections=ingested_sections,
+      skipped_sections=skipped_sections,
+      error_count=error_count,
+      error_sample=errors,
+    )
+    connection.commit()
+  finally:
+    if args.fast_load and not fast_load_finalized:
+      # The run is unwinding with the FTS triggers and secondary indexes
+      # still dropped; batches committed so far would otherwise stay
+      # missing from law_documents_fts, because the sha-based skip never
+      # rewrites them. Restore and rebuild before letting go.
+      connection.rollback()
+      try:
+        end_fast_load(connection)
+      except sqlite3.Error:
+        pass
+    close_connection(connection)
 
   summary = {
     "started_at": started_at,
@@ -707,6 +1324,8 @@ def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
 
 def main(argv: list[str]) -> int:
   args = parse_args(argv)
+  if args.server:
+    return run_server()
   try:
     summary = run_ingestion(args)
   except Exception as error:  # noqa: BLE001
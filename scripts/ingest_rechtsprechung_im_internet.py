@@ -10,32 +10,58 @@ Data source:
 from __future__ import annotations
 
 import argparse
+import collections
+import concurrent.futures
 import datetime as dt
+import heapq
 import io
 import json
-import re
+import queue
 import sqlite3
+import struct
 import sys
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
 import zipfile
+import zlib
 from dataclasses import dataclass
-from typing import Iterable
+from operator import attrgetter
+from typing import Iterable, Iterator
 from xml.etree import ElementTree as ET
 
+try:
+  import lxml.etree as LET
+except ImportError:  # lxml is installed in CI; ElementTree remains the fallback
+  LET = None
+
+try:
+  import requests
+except ImportError:  # requests is installed in CI; urllib remains the fallback
+  requests = None
+
 DEFAULT_TOC_URL = "https://www.rechtsprechung-im-internet.de/rii-toc.xml"
 DEFAULT_DB_PATH = "data/database.db"
 DEFAULT_TIMEOUT = 60
 DEFAULT_RETRIES = 3
 DEFAULT_SLEEP_SECONDS = 0.0
+DEFAULT_WORKERS = 16
 USER_AGENT = "ansvar-german-law-mcp/0.1"
 NO_PROXY_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
-WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# One pooled session shared by the download workers: TLS handshakes are
+# amortized across the per-case ZIP fetches instead of paid per request.
+if requests is not None:
+  SESSION = requests.Session()
+  SESSION.trust_env = False
+  _ADAPTER = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=DEFAULT_WORKERS * 2)
+  SESSION.mount("https://", _ADAPTER)
+  SESSION.mount("http://", _ADAPTER)
+else:
+  SESSION = None
 
 SCHEMA_SQL = """
-PRAGMA journal_mode = DELETE;
 PRAGMA foreign_keys = ON;
 
 CREATE TABLE IF NOT EXISTS case_law_documents (
@@ -52,10 +78,12 @@ CREATE TABLE IF NOT EXISTS case_law_documents (
   source_url TEXT NOT NULL,
   text_snippet TEXT,
   metadata_json TEXT,
+  toc_modified TEXT,
   updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX IF NOT EXISTS idx_case_law_case_id ON case_law_documents(case_id);
+CREATE INDEX IF NOT EXISTS idx_case_law_case_id_upper ON case_law_documents(UPPER(case_id));
 CREATE INDEX IF NOT EXISTS idx_case_law_ecli ON case_law_documents(ecli);
 CREATE INDEX IF NOT EXISTS idx_case_law_court ON case_law_documents(court);
 CREATE INDEX IF NOT EXISTS idx_case_law_decision_date ON case_law_documents(decision_date);
@@ -69,6 +97,26 @@ CREATE VIRTUAL TABLE IF NOT EXISTS case_law_documents_fts USING fts5(
   tokenize='unicode61'
 );
 
+CREATE TABLE IF NOT EXISTS ingestion_runs (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  source_id TEXT NOT NULL,
+  started_at TEXT NOT NULL,
+  finished_at TEXT,
+  status TEXT NOT NULL,
+  total_laws INTEGER NOT NULL DEFAULT 0,
+  ingested_laws INTEGER NOT NULL DEFAULT 0,
+  skipped_laws INTEGER NOT NULL DEFAULT 0,
+  ingested_sections INTEGER NOT NULL DEFAULT 0,
+  skipped_sections INTEGER NOT NULL DEFAULT 0,
+  error_count INTEGER NOT NULL DEFAULT 0,
+  error_sample TEXT,
+  notes TEXT
+);
+"""
+
+# Kept out of SCHEMA_SQL so --bulk can drop the triggers for the run and
+# rebuild the FTS index in one pass afterwards.
+FTS_TRIGGERS_SQL = """
 CREATE TRIGGER IF NOT EXISTS case_law_documents_ai
 AFTER INSERT ON case_law_documents
 BEGIN
@@ -91,26 +139,19 @@ BEGIN
   INSERT INTO case_law_documents_fts(rowid, title, citation, text_snippet)
   VALUES (new.rowid, new.title, COALESCE(new.citation, ''), COALESCE(new.text_snippet, ''));
 END;
+"""
 
-CREATE TABLE IF NOT EXISTS ingestion_runs (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  source_id TEXT NOT NULL,
-  started_at TEXT NOT NULL,
-  finished_at TEXT,
-  status TEXT NOT NULL,
-  total_laws INTEGER NOT NULL DEFAULT 0,
-  ingested_laws INTEGER NOT NULL DEFAULT 0,
-  skipped_laws INTEGER NOT NULL DEFAULT 0,
-  ingested_sections INTEGER NOT NULL DEFAULT 0,
-  skipped_sections INTEGER NOT NULL DEFAULT 0,
-  error_count INTEGER NOT NULL DEFAULT 0,
-  error_sample TEXT,
-  notes TEXT
-);
+DROP_FTS_TRIGGERS_SQL = """
+DROP TRIGGER IF EXISTS case_law_documents_ai;
+DROP TRIGGER IF EXISTS case_law_documents_ad;
+DROP TRIGGER IF EXISTS case_law_documents_au;
 """
 
 
-@dataclass(frozen=True)
+# slots halves the per-instance footprint, which matters with a six-figure
+# TOC held in memory; plain (non-frozen) init also skips the
+# object.__setattr__ call per field.
+@dataclass(slots=True)
 class TocItem:
   case_id: str
   court: str
@@ -120,8 +161,9 @@ class TocItem:
   modified: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedCase:
+  row_id: str
   case_id: str
   ecli: str | None
   court: str | None
@@ -131,8 +173,9 @@ class ParsedCase:
   title: str
   citation: str | None
   source_url: str
-  text_snippet: str
+  text_snippet: str | None
   metadata_json: str
+  toc_modified: str | None
 
 
 def now_iso() -> str:
@@ -140,9 +183,11 @@ def now_iso() -> str:
 
 
 def collapse_whitespace(value: str | None) -> str:
+  # str.split() handles whitespace runs and stripping in one C loop; this is
+  # called ~20 times per case, so skipping the regex engine adds up.
   if not value:
     return ""
-  return WHITESPACE_PATTERN.sub(" ", value).strip()
+  return " ".join(value.split())
 
 
 def normalize_zip_url(raw_url: str) -> str:
@@ -167,70 +212,134 @@ def normalize_decision_date(raw_value: str | None) -> str | None:
   value = collapse_whitespace(raw_value)
   if not value:
     return None
-  if re.fullmatch(r"\d{8}", value):
-    return f"{value[0:4]}-{value[4:6]}-{value[6:8]}"
-  if re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
+  # Pure string checks: both accepted shapes are fixed-width, so a length
+  # test plus isdigit() beats entering the regex engine per case.
+  if len(value) == 8 and value.isdigit():
+    return value[0:4] + "-" + value[4:6] + "-" + value[6:8]
+  if (
+    len(value) == 10
+    and value[4] == "-"
+    and value[7] == "-"
+    and value[0:4].isdigit()
+    and value[5:7].isdigit()
+    and value[8:10].isdigit()
+  ):
     return value
   return None
 
 
+def _is_retryable_http_error(error: Exception) -> bool:
+  if isinstance(error, (urllib.error.URLError, TimeoutError)):
+    return True
+  return requests is not None and isinstance(error, requests.RequestException)
+
+
 def http_get(url: str, timeout: int, retries: int) -> bytes:
-  request = urllib.request.Request(
-    url,
-    headers={
-      "User-Agent": USER_AGENT,
-      "Accept": "*/*",
-    },
-  )
+  headers = {"User-Agent": USER_AGENT, "Accept": "*/*"}
 
   attempt = 0
   while True:
     attempt += 1
     try:
+      if SESSION is not None:
+        response = SESSION.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+      request = urllib.request.Request(url, headers=headers)
       with NO_PROXY_OPENER.open(request, timeout=timeout) as response:
         return response.read()
-    except (urllib.error.URLError, TimeoutError) as error:
+    except Exception as error:  # noqa: BLE001
+      if not _is_retryable_http_error(error):
+        raise
       if attempt >= retries:
         raise RuntimeError(f"HTTP GET failed after {retries} attempts for {url}: {error}") from error
       time.sleep(min(2**attempt, 8))
 
 
-def parse_toc(xml_payload: bytes) -> list[TocItem]:
-  root = ET.fromstring(xml_payload)
-  items: list[TocItem] = []
+def _toc_item_from_element(element: ET.Element) -> TocItem | None:
+  link = collapse_whitespace(element.findtext("link"))
+  if not link:
+    return None
+  case_id = extract_case_id(link)
+  if not case_id:
+    return None
+  return TocItem(
+    case_id=case_id,
+    court=collapse_whitespace(element.findtext("gericht")),
+    decision_date=collapse_whitespace(element.findtext("entsch-datum")),
+    file_number=collapse_whitespace(element.findtext("aktenzeichen")),
+    zip_url=normalize_zip_url(link),
+    modified=collapse_whitespace(element.findtext("modified")),
+  )
+
 
-  for item in root.findall("./item"):
-    link = collapse_whitespace(item.findtext("link"))
-    if not link:
+def parse_toc(xml_payload: bytes) -> Iterator[TocItem]:
+  """Yield TOC entries via iterparse; the multi-MB document never becomes a DOM.
+
+  Each <item> subtree is cleared as soon as its TocItem is built, so peak
+  memory stays at one entry regardless of TOC size.
+  """
+  if LET is not None:
+    for _event, element in LET.iterparse(io.BytesIO(xml_payload), events=("end",), tag="item"):
+      item = _toc_item_from_element(element)
+      element.clear()
+      while element.getprevious() is not None:
+        del element.getparent()[0]
+      if item is not None:
+        yield item
+    return
+
+  root: ET.Element | None = None
+  for event, element in ET.iterparse(io.BytesIO(xml_payload), events=("start", "end")):
+    if event == "start":
+      if root is None:
+        root = element
       continue
-    case_id = extract_case_id(link)
-    if not case_id:
+    if element.tag != "item":
       continue
+    item = _toc_item_from_element(element)
+    element.clear()
+    if root is not None:
+      root.clear()
+    if item is not None:
+      yield item
+
+
+# Every payload field sits as a direct child of <dokument>; one walk over the
+# root children replaces a separate find() scan per tag.
+CASE_FIELD_TAGS = frozenset(
+  {
+    "doknr",
+    "ecli",
+    "gertyp",
+    "spruchkoerper",
+    "entsch-datum",
+    "aktenzeichen",
+    "doktyp",
+    "norm",
+    "titelzeile",
+    "leitsatz",
+    "tenor",
+    "gruende",
+    "entscheidungsgruende",
+    "tatbestand",
+  }
+)
 
-    court = collapse_whitespace(item.findtext("gericht"))
-    decision_date = collapse_whitespace(item.findtext("entsch-datum"))
-    file_number = collapse_whitespace(item.findtext("aktenzeichen"))
-    modified = collapse_whitespace(item.findtext("modified"))
-
-    items.append(
-      TocItem(
-        case_id=case_id,
-        court=court,
-        decision_date=decision_date,
-        file_number=file_number,
-        zip_url=normalize_zip_url(link),
-        modified=modified,
-      )
-    )
-
-  return items
 
+def extract_case_fields(root: ET.Element) -> dict[str, str]:
+  """Collect all known tags in a single pass over the document root.
 
-def xml_text(root: ET.Element, tag: str) -> str:
-  node = root.find(tag)
-  if node is None:
-    return ""
-  return collapse_whitespace(" ".join(part for part in node.itertext()))
+  Splitting each itertext() chunk as it streams keeps the whitespace
+  collapse to one join per field; first occurrence wins, matching the old
+  find() semantics.
+  """
+  fields: dict[str, str] = {}
+  for child in root:
+    tag = child.tag
+    if tag in CASE_FIELD_TAGS and tag not in fields:
+      fields[tag] = " ".join(word for chunk in child.itertext() for word in chunk.split())
+  return fields
 
 
 def build_case_title(
@@ -257,60 +366,133 @@ def build_text_snippet(
   tatbestand: str,
   norm: str,
 ) -> str:
+  # The inputs come out of xml_text already collapsed, so one join is enough.
   parts = [part for part in [leitsatz, tenor, gruende, tatbestand, norm] if part]
-  merged = collapse_whitespace(" ".join(parts))
+  merged = " ".join(parts)
   if len(merged) > 24000:
     return merged[:24000]
   return merged
 
 
+# ZIP local file header: signature, version, flags, method, mtime, mdate,
+# crc32, compressed size, uncompressed size, name length, extra length.
+ZIP_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+
+
+def _unzip_single(zip_payload: bytes) -> bytes | None:
+  """Extract the sole XML member straight from the local file header.
+
+  The per-case archives hold exactly one deflated XML file, so the central
+  directory, CRC pass, and BytesIO/ZipFile layers are pure overhead; one
+  struct.unpack plus zlib.decompress replaces them. Returns None for any
+  layout that does not match, and the caller falls back to zipfile.
+  """
+  if len(zip_payload) < ZIP_LOCAL_HEADER.size or not zip_payload.startswith(b"PK\x03\x04"):
+    return None
+  _sig, _version, flags, method, _mtime, _mdate, _crc, comp_size, _uncomp_size, name_len, extra_len = (
+    ZIP_LOCAL_HEADER.unpack_from(zip_payload)
+  )
+  # Encrypted entries or deferred sizes (data-descriptor flag) need zipfile.
+  if flags & 0x09 or comp_size == 0:
+    return None
+  name_end = ZIP_LOCAL_HEADER.size + name_len
+  if not zip_payload[ZIP_LOCAL_HEADER.size : name_end].lower().endswith(b".xml"):
+    return None
+  start = name_end + extra_len
+  blob = zip_payload[start : start + comp_size]
+  if len(blob) != comp_size:
+    return None
+  if method == 8:
+    try:
+      return zlib.decompress(blob, -15)
+    except zlib.error:
+      return None
+  if method == 0:
+    return blob
+  return None
+
+
+def _parse_xml_stream(stream) -> ET.Element:
+  """Feed a file-like object into the parser in chunks.
+
+  Used on the zipfile fallback path so the decompressed XML never exists as
+  one full bytes copy; with the thread pool holding several payloads at
+  once, peak memory per worker stays at one chunk.
+  """
+  if LET is not None:
+    return LET.parse(stream).getroot()
+  parser = ET.XMLParser()
+  while chunk := stream.read(65536):
+    parser.feed(chunk)
+  return parser.close()
+
+
 def parse_case_package(item: TocItem, zip_payload: bytes) -> ParsedCase:
-  with zipfile.ZipFile(io.BytesIO(zip_payload), "r") as archive:
-    xml_members = [name for name in archive.namelist() if name.lower().endswith(".xml")]
-    if not xml_members:
-      raise RuntimeError(f"No XML file found in archive for {item.case_id}")
-    xml_payload = archive.read(xml_members[0])
-
-  root = ET.fromstring(xml_payload)
-  doknr = xml_text(root, "doknr") or item.case_id
-  ecli = xml_text(root, "ecli") or None
-  court_type = xml_text(root, "gertyp")
-  chamber = xml_text(root, "spruchkoerper")
-  court = collapse_whitespace(" ".join(part for part in [court_type, chamber] if part)) or None
-  decision_date = normalize_decision_date(xml_text(root, "entsch-datum") or item.decision_date)
-  file_number = xml_text(root, "aktenzeichen") or item.file_number or None
-  decision_type = xml_text(root, "doktyp") or None
-  norm = xml_text(root, "norm")
-  titelzeile = xml_text(root, "titelzeile")
-  leitsatz = xml_text(root, "leitsatz")
-  tenor = xml_text(root, "tenor")
-  gruende = xml_text(root, "gruende") or xml_text(root, "entscheidungsgruende")
-  tatbestand = xml_text(root, "tatbestand")
+  xml_payload = _unzip_single(zip_payload)
+  if xml_payload is not None:
+    # lxml parses in C and is API-compatible for the iteration below.
+    root = LET.fromstring(xml_payload) if LET is not None else ET.fromstring(xml_payload)
+  else:
+    with zipfile.ZipFile(io.BytesIO(zip_payload), "r") as archive:
+      xml_members = [name for name in archive.namelist() if name.lower().endswith(".xml")]
+      if not xml_members:
+        raise RuntimeError(f"No XML file found in archive for {item.case_id}")
+      with archive.open(xml_members[0]) as stream:
+        root = _parse_xml_stream(stream)
+  fields = extract_case_fields(root)
+  text = fields.get
+  doknr = text("doknr", "") or item.case_id
+  ecli = text("ecli", "") or None
+  court_type = text("gertyp", "")
+  chamber = text("spruchkoerper", "")
+  court = " ".join(part for part in [court_type, chamber] if part) or None
+  decision_date = normalize_decision_date(text("entsch-datum", "") or item.decision_date)
+  file_number = text("aktenzeichen", "") or item.file_number or None
+  decision_type = text("doktyp", "") or None
+  norm = text("norm", "")
+  titelzeile = text("titelzeile", "")
+  leitsatz = text("leitsatz", "")
+  tenor = text("tenor", "")
+  gruende = text("gruende", "") or text("entscheidungsgruende", "")
+  tatbestand = text("tatbestand", "")
 
   title = build_case_title(titelzeile, leitsatz, court, decision_date, file_number)
   snippet = build_text_snippet(leitsatz, tenor, gruende, tatbestand, norm)
   citation = ecli or file_number or None
   source_url = item.zip_url
 
-  metadata_payload = {
+  # Only populated keys are added, so no throwaway full dict plus filter
+  # pass is built per case before serialization.
+  metadata_compact: dict[str, str] = {
     "source": "rechtsprechung-im-internet",
     "case_id": doknr,
     "toc_case_id": item.case_id,
-    "ecli": ecli,
-    "court_toc": item.court or None,
-    "court_xml": court,
-    "decision_date_toc": normalize_decision_date(item.decision_date),
-    "decision_date_xml": decision_date,
-    "file_number_toc": item.file_number or None,
-    "file_number_xml": file_number,
-    "decision_type": decision_type,
-    "norm": norm or None,
-    "zip_url": item.zip_url,
-    "modified": item.modified or None,
   }
-  metadata_compact = {key: value for key, value in metadata_payload.items() if value not in (None, "")}
+  if ecli:
+    metadata_compact["ecli"] = ecli
+  if item.court:
+    metadata_compact["court_toc"] = item.court
+  if court:
+    metadata_compact["court_xml"] = court
+  decision_date_toc = normalize_decision_date(item.decision_date)
+  if decision_date_toc:
+    metadata_compact["decision_date_toc"] = decision_date_toc
+  if decision_date:
+    metadata_compact["decision_date_xml"] = decision_date
+  if item.file_number:
+    metadata_compact["file_number_toc"] = item.file_number
+  if file_number:
+    metadata_compact["file_number_xml"] = file_number
+  if decision_type:
+    metadata_compact["decision_type"] = decision_type
+  if norm:
+    metadata_compact["norm"] = norm
+  metadata_compact["zip_url"] = item.zip_url
+  if item.modified:
+    metadata_compact["modified"] = item.modified
 
   return ParsedCase(
+    row_id=f"case:{doknr.lower()}",
     case_id=doknr,
     ecli=ecli,
     court=court or item.court or None,
@@ -322,11 +504,113 @@ def parse_case_package(item: TocItem, zip_payload: bytes) -> ParsedCase:
     source_url=source_url,
     text_snippet=snippet,
     metadata_json=json.dumps(metadata_compact, ensure_ascii=False),
+    toc_modified=item.modified or None,
+  )
+
+
+def build_toc_case(item: TocItem) -> ParsedCase:
+  """Build a row from TOC fields alone, with no ZIP download or XML parse.
+
+  The snippet stays NULL to mark the row as needing a later --enrich pass.
+  """
+  decision_date = normalize_decision_date(item.decision_date)
+  court = item.court or None
+  file_number = item.file_number or None
+  metadata: dict[str, str] = {
+    "source": "rechtsprechung-im-internet",
+    "case_id": item.case_id,
+    "toc_case_id": item.case_id,
+  }
+  if court:
+    metadata["court_toc"] = court
+  if decision_date:
+    metadata["decision_date_toc"] = decision_date
+  if file_number:
+    metadata["file_number_toc"] = file_number
+  metadata["zip_url"] = item.zip_url
+  if item.modified:
+    metadata["modified"] = item.modified
+
+  return ParsedCase(
+    row_id=f"case:{item.case_id.lower()}",
+    case_id=item.case_id,
+    ecli=None,
+    court=court,
+    decision_date=decision_date,
+    file_number=file_number,
+    decision_type=None,
+    title=build_case_title("", "", court, decision_date, file_number),
+    citation=file_number,
+    source_url=item.zip_url,
+    text_snippet=None,
+    metadata_json=json.dumps(metadata, ensure_ascii=False),
+    toc_modified=item.modified or None,
   )
 
 
+def configure_connection(connection: sqlite3.Connection) -> None:
+  """Tune the connection for bulk ingestion.
+
+  WAL with synchronous=NORMAL collapses per-commit fsyncs and lets readers
+  (the MCP server) keep querying while an ingest is running; busy_timeout
+  makes BEGIN IMMEDIATE back off while a sibling ingestor holds the write
+  lock instead of failing with "database is locked".
+  """
+  connection.execute("PRAGMA journal_mode = WAL")
+  connection.execute("PRAGMA synchronous = NORMAL")
+  connection.execute("PRAGMA temp_store = MEMORY")
+  connection.execute("PRAGMA cache_size = -65536")
+  connection.execute("PRAGMA busy_timeout = 30000")
+
+
+def close_connection(connection: sqlite3.Connection) -> None:
+  try:
+    connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+  except sqlite3.Error:
+    pass
+  connection.close()
+
+
 def ensure_schema(connection: sqlite3.Connection) -> None:
   connection.executescript(SCHEMA_SQL)
+  # Databases created before toc_modified existed keep their old shape under
+  # CREATE TABLE IF NOT EXISTS, so widen them in place.
+  columns = {row[1] for row in connection.execute("PRAGMA table_info(case_law_documents)")}
+  if "toc_modified" not in columns:
+    connection.execute("ALTER TABLE case_law_documents ADD COLUMN toc_modified TEXT")
+  connection.executescript(FTS_TRIGGERS_SQL)
+
+
+def begin_unsafe_fast(connection: sqlite3.Connection) -> None:
+  """Drop fsyncs for the run; only for ingests that are safe to re-run.
+
+  A crash mid-run can corrupt the database, but TOC-driven ingestion is
+  idempotent, so --unsafe-fast trades durability for write throughput.
+  """
+  connection.execute("PRAGMA journal_mode = MEMORY")
+  connection.execute("PRAGMA synchronous = OFF")
+
+
+def end_unsafe_fast(connection: sqlite3.Connection) -> None:
+  """Restore the durable WAL settings; runs in a finally so an error cannot
+  leave the database file out of WAL mode."""
+  try:
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+  except sqlite3.Error:
+    pass
+
+
+def begin_bulk_fts(connection: sqlite3.Connection) -> None:
+  """Drop FTS triggers so bulk inserts skip per-row shadow-table writes."""
+  connection.executescript(DROP_FTS_TRIGGERS_SQL)
+
+
+def end_bulk_fts(connection: sqlite3.Connection) -> None:
+  """Rebuild FTS from content in one pass and restore the triggers."""
+  connection.execute("INSERT INTO case_law_documents_fts(case_law_documents_fts) VALUES('rebuild')")
+  connection.executescript(FTS_TRIGGERS_SQL)
 
 
 def insert_ingestion_run_start(connection: sqlite3.Connection, source_id: str, started_at: str, total_cases: int) -> int:
@@ -381,55 +665,90 @@ def finalize_ingestion_run(
   )
 
 
+# Indexed point probe (idx_case_law_case_id_upper); replaces materializing
+# every stored case_id into a Python set, which grows with the corpus.
+CASE_EXISTS_SQL = "SELECT 1 FROM case_law_documents WHERE UPPER(case_id) = ? LIMIT 1"
+
+
 def case_exists(connection: sqlite3.Connection, case_id: str) -> bool:
-  row = connection.execute(
-    "SELECT 1 FROM case_law_documents WHERE case_id = ? LIMIT 1",
-    (case_id,),
-  ).fetchone()
-  return bool(row)
+  return connection.execute(CASE_EXISTS_SQL, (case_id.upper(),)).fetchone() is not None
+
+
+# toc_modified drives the unchanged-skip; the snippet NULLness says whether
+# the row was staged by --toc-only and still needs its full text fetched.
+CASE_STATE_SQL = "SELECT toc_modified, text_snippet IS NULL FROM case_law_documents WHERE UPPER(case_id) = ? LIMIT 1"
+
+
+def case_state(connection: sqlite3.Connection, case_id: str):
+  return connection.execute(CASE_STATE_SQL, (case_id.upper(),)).fetchone()
+
+
+def count_cases(connection: sqlite3.Connection) -> int:
+  return int(connection.execute("SELECT COUNT(*) FROM case_law_documents").fetchone()[0])
+
+
+# Hoisted so sqlite3's statement cache sees identical text for every flush.
+CASE_UPSERT_SQL = """
+INSERT INTO case_law_documents (
+  id, country, case_id, ecli, court, decision_date, file_number, decision_type, title, citation, source_url, text_snippet, metadata_json, toc_modified, updated_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+  country = excluded.country,
+  case_id = excluded.case_id,
+  ecli = excluded.ecli,
+  court = excluded.court,
+  decision_date = excluded.decision_date,
+  file_number = excluded.file_number,
+  decision_type = excluded.decision_type,
+  title = excluded.title,
+  citation = excluded.citation,
+  source_url = excluded.source_url,
+  text_snippet = excluded.text_snippet,
+  metadata_json = excluded.metadata_json,
+  toc_modified = excluded.toc_modified,
+  updated_at = excluded.updated_at
+"""
 
+# Rows queued between executemany flushes; small enough that a failed flush
+# loses little work, large enough to amortize the Python-to-C dispatch.
+FLUSH_EVERY = 200
 
-def upsert_case(connection: sqlite3.Connection, case: ParsedCase) -> None:
-  now = now_iso()
-  with connection:
-    connection.execute(
-      """
-      INSERT INTO case_law_documents (
-        id, country, case_id, ecli, court, decision_date, file_number, decision_type, title, citation, source_url, text_snippet, metadata_json, updated_at
-      )
-      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-      ON CONFLICT(id) DO UPDATE SET
-        country = excluded.country,
-        case_id = excluded.case_id,
-        ecli = excluded.ecli,
-        court = excluded.court,
-        decision_date = excluded.decision_date,
-        file_number = excluded.file_number,
-        decision_type = excluded.decision_type,
-        title = excluded.title,
-        citation = excluded.citation,
-        source_url = excluded.source_url,
-        text_snippet = excluded.text_snippet,
-        metadata_json = excluded.metadata_json,
-        updated_at = excluded.updated_at
-      """,
-      (
-        f"case:{case.case_id.lower()}",
-        "de",
-        case.case_id,
-        case.ecli,
-        case.court,
-        case.decision_date,
-        case.file_number,
-        case.decision_type,
-        case.title,
-        case.citation,
-        case.source_url,
-        case.text_snippet,
-        case.metadata_json,
-        now,
-      ),
+
+def queue_case(buffer: list[tuple], case: ParsedCase) -> None:
+  buffer.append(
+    (
+      case.row_id,
+      "de",
+      case.case_id,
+      case.ecli,
+      case.court,
+      case.decision_date,
+      case.file_number,
+      case.decision_type,
+      case.title,
+      case.citation,
+      case.source_url,
+      case.text_snippet,
+      case.metadata_json,
+      case.toc_modified,
+      now_iso(),
     )
+  )
+
+
+def flush_cases(connection: sqlite3.Connection, buffer: list[tuple]) -> int:
+  """Push queued rows through one executemany; the caller owns the transaction.
+
+  Returns the number of rows written; the buffer is cleared only on success
+  so the caller can account for dropped rows when a flush fails.
+  """
+  if not buffer:
+    return 0
+  connection.executemany(CASE_UPSERT_SQL, buffer)
+  flushed = len(buffer)
+  buffer.clear()
+  return flushed
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -447,6 +766,16 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
   parser.add_argument("--case-id", action="append", default=[], help="Only ingest selected case id(s), repeatable")
   parser.add_argument("--court-contains", default=None, help="Only ingest cases where the court contains this string")
   parser.add_argument("--only-missing", action="store_true", help="Only ingest cases not yet present in case_law_documents")
+  parser.add_argument(
+    "--toc-only",
+    action="store_true",
+    help="Stage rows from TOC metadata without downloading any case packages; fill text later with --enrich",
+  )
+  parser.add_argument(
+    "--enrich",
+    action="store_true",
+    help="Only download cases whose stored row still lacks full text (staged by --toc-only)",
+  )
   parser.add_argument("--refresh-existing", action="store_true", help="Re-ingest cases already present in the database")
   parser.add_argument(
     "--stop-after-existing",
@@ -454,28 +783,94 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     default=None,
     help="Stop after N consecutive already-known case IDs (for fast incremental updates).",
   )
-  parser.add_argument("--sleep-seconds", type=float, default=DEFAULT_SLEEP_SECONDS, help="Pause between case downloads")
+  parser.add_argument("--sleep-seconds", type=float, default=DEFAULT_SLEEP_SECONDS, help="Per-worker pause before each case download")
+  parser.add_argument(
+    "--workers",
+    type=int,
+    default=DEFAULT_WORKERS,
+    help=f"Number of parallel download workers (default: {DEFAULT_WORKERS})",
+  )
+  parser.add_argument(
+    "--unsafe-fast",
+    action="store_true",
+    help="Run with synchronous=OFF and an in-memory journal; a crash mid-run can corrupt the database, so only use for re-runnable backfills",
+  )
+  parser.add_argument(
+    "--bulk",
+    action="store_true",
+    help="Drop FTS triggers for the run and rebuild the index once at the end (for large backfills; incremental runs should keep the trigger path)",
+  )
+  parser.add_argument(
+    "--commit-every",
+    type=int,
+    default=500,
+    help="Commit the write transaction after this many cases (default: 500)",
+  )
   parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help=f"HTTP timeout in seconds (default: {DEFAULT_TIMEOUT})")
   parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help=f"HTTP retries (default: {DEFAULT_RETRIES})")
   parser.add_argument("--quiet", action="store_true", help="Suppress per-case progress logs")
   parser.add_argument("--dry-run", action="store_true", help="Resolve and report ingestion scope only")
   parser.add_argument("--report-path", default=None, help="Optional path to write summary JSON")
+  parser.add_argument(
+    "--error-log-path",
+    default=None,
+    help="Optional path to append one JSON line per error; the summary keeps only a bounded sample",
+  )
+  parser.add_argument(
+    "--server",
+    action="store_true",
+    help="Worker mode: read one JSON argv array per stdin line, write one JSON report per stdout line",
+  )
   return parser.parse_args(argv)
 
 
+def run_server() -> int:
+  """Serve ingestion commands over stdin so the orchestrator can keep one
+  resident worker per source instead of paying interpreter startup per cycle."""
+  for line in sys.stdin:
+    command = line.strip()
+    if not command:
+      continue
+    try:
+      command_args = parse_args([str(item) for item in json.loads(command)])
+      summary = run_ingestion(command_args)
+    except (Exception, SystemExit) as error:  # noqa: BLE001
+      summary = {
+        "started_at": now_iso(),
+        "finished_at": now_iso(),
+        "status": "failed",
+        "source_id": "rechtsprechung-im-internet",
+        "error": str(error),
+      }
+    print(json.dumps(summary, ensure_ascii=False), flush=True)
+  return 0
+
+
 def filter_items(items: Iterable[TocItem], args: argparse.Namespace) -> list[TocItem]:
   filtered = list(items)
 
   if args.order == "latest":
-    filtered = sorted(
-      filtered,
-      key=lambda item: (
-        collapse_whitespace(item.modified),
-        collapse_whitespace(item.decision_date),
-        item.case_id,
-      ),
-      reverse=True,
-    )
+    # parse_toc already collapsed these fields; attrgetter builds the key
+    # tuple in C, with no Python frame per comparison.
+    latest_key = attrgetter("modified", "decision_date", "case_id")
+
+    # When only the newest K entries survive anyway, a bounded heap beats
+    # sorting the whole TOC: O(N log K) vs O(N log N). Any filter applied
+    # after the sort could widen the needed K, so the heap is used only
+    # when none of them is active.
+    top_k: int | None = None
+    if (
+      args.max_cases is not None
+      and args.max_cases >= 0
+      and not args.only_missing
+      and not args.case_id
+      and not args.court_contains
+    ):
+      top_k = args.max_cases + max(0, args.offset)
+    if top_k is not None:
+      filtered = heapq.nlargest(top_k, filtered, key=latest_key)
+    else:
+      filtered = sorted(filtered, key=latest_key, reverse=True)
 
   if args.case_id:
     selected = {value.strip().upper() for value in args.case_id if value.strip()}
@@ -494,28 +889,24 @@ def filter_items(items: Iterable[TocItem], args: argparse.Namespace) -> list[Toc
   return filtered
 
 
-def fetch_existing_case_ids(connection: sqlite3.Connection) -> set[str]:
-  rows = connection.execute("SELECT case_id FROM case_law_documents").fetchall()
-  return {str(row[0]).upper() for row in rows}
-
-
 def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
   started_at = now_iso()
   toc_payload = http_get(args.toc_url, timeout=args.timeout, retries=args.retries)
-  toc_items = parse_toc(toc_payload)
+  # The item list itself is small next to the XML DOM parse_toc streams
+  # away; the list is kept for len() in the summary and the latest-sort.
+  toc_items = list(parse_toc(toc_payload))
   selected_items = filter_items(toc_items, args)
 
   if args.dry_run:
     existing_count = None
     missing_count = None
     if args.only_missing:
-      connection = sqlite3.connect(args.db_path)
+      connection = sqlite3.connect(args.db_path, isolation_level=None)
       ensure_schema(connection)
-      existing_ids = fetch_existing_case_ids(connection)
-      selected_items = [item for item in selected_items if item.case_id.upper() not in existing_ids]
+      selected_items = [item for item in selected_items if not case_exists(connection, item.case_id)]
       if args.max_cases is not None and args.max_cases >= 0:
         selected_items = selected_items[: args.max_cases]
-      existing_count = len(existing_ids)
+      existing_count = count_cases(connection)
       missing_count = len(selected_items)
       connection.close()
 
@@ -535,48 +926,75 @@ def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
       summary["missing_cases"] = missing_count
     return summary
 
-  connection = sqlite3.connect(args.db_path)
+  # isolation_level=None turns off the driver's implicit BEGINs: every
+  # statement autocommits unless inside an explicit BEGIN IMMEDIATE below,
+  # so the transaction boundaries are exactly the ones written here.
+  connection = sqlite3.connect(args.db_path, isolation_level=None)
   connection.row_factory = sqlite3.Row
+  configure_connection(connection)
   ensure_schema(connection)
-  if args.only_missing:
-    existing_ids = fetch_existing_case_ids(connection)
-    if args.stop_after_existing is None:
-      selected_items = [item for item in selected_items if item.case_id.upper() not in existing_ids]
-      if args.max_cases is not None and args.max_cases >= 0:
-        selected_items = selected_items[: args.max_cases]
-  else:
-    existing_ids = set()
+  if args.unsafe_fast:
+    begin_unsafe_fast(connection)
+  error_log = None
+  bulk_finalized = False
+  try:
+    if args.bulk:
+      begin_bulk_fts(connection)
+    existing_count_before = 0
+    if args.only_missing:
+      existing_count_before = count_cases(connection)
+      if args.stop_after_existing is None:
+        selected_items = [item for item in selected_items if not case_exists(connection, item.case_id)]
+        if args.max_cases is not None and args.max_cases >= 0:
+          selected_items = selected_items[: args.max_cases]
 
-  connection.execute(
-    """
-    UPDATE ingestion_runs
-    SET status = 'interrupted',
-        finished_at = COALESCE(finished_at, ?),
-        notes = COALESCE(notes, 'Run was interrupted before finalization.')
-    WHERE status = 'running'
-    """,
-    (now_iso(),),
-  )
-  connection.commit()
+    connection.execute(
+      """
+      UPDATE ingestion_runs
+      SET status = 'interrupted',
+          finished_at = COALESCE(finished_at, ?),
+          notes = COALESCE(notes, 'Run was interrupted before finalization.')
+      WHERE status = 'running'
+      """,
+      (now_iso(),),
+    )
 
-  run_id = insert_ingestion_run_start(
-    connection=connection,
-    source_id="rechtsprechung-im-internet",
-    started_at=started_at,
-    total_cases=len(selected_items),
-  )
+    # In autocommit mode the run row is durable on its own; the batched
+    # write transaction below starts from a clean state.
+    run_id = insert_ingestion_run_start(
+      connection=connection,
+      source_id="rechtsprechung-im-internet",
+      started_at=started_at,
+      total_cases=len(selected_items),
+    )
 
-  ingested_cases = 0
-  skipped_cases = 0
-  processed_cases = 0
-  error_count = 0
-  errors: list[str] = []
-  consecutive_existing = 0
-  stop_reason: str | None = None
+    ingested_cases = 0
+    skipped_cases = 0
+    processed_cases = 0
+    error_count = 0
+    # Bounded rolling sample: a run with thousands of failures keeps at most
+    # the newest 20 messages in memory; --error-log-path gets the full stream.
+    errors: collections.deque[str] = collections.deque(maxlen=20)
+    consecutive_existing = 0
+    stop_reason: str | None = None
+
+    def record_error(message: str) -> None:
+      nonlocal error_count, error_log
+      error_count += 1
+      errors.append(message)
+      if args.error_log_path:
+        if error_log is None:
+          error_log = open(args.error_log_path, "a", encoding="utf-8")
+        error_log.write(json.dumps({"ts": now_iso(), "error": message}, ensure_ascii=False) + "\n")
+      if not args.quiet:
+        print(f"[error] {message}", file=sys.stderr)
 
-  for index, item in enumerate(selected_items, start=1):
-    try:
-      if args.only_missing and item.case_id.upper() in existing_ids and not args.refresh_existing:
+    # Skip decisions depend only on the TOC and the existing-id set, so they
+    # run in a sequential pre-scan that preserves --stop-after-existing
+    # semantics; only the survivors are handed to the download pool.
+    pending_items: list[TocItem] = []
+    for index, item in enumerate(selected_items, start=1):
+      if args.only_missing and not args.refresh_existing and case_exists(connection, item.case_id):
         skipped_cases += 1
         processed_cases += 1
         consecutive_existing += 1
@@ -593,52 +1011,218 @@ def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
           stop_reason = "consecutive_existing_threshold"
           break
         continue
-
       consecutive_existing = 0
-      if args.max_cases is not None and args.max_cases >= 0 and ingested_cases >= args.max_cases:
+      state = case_state(connection, item.case_id)
+      if args.enrich:
+        # Enrichment only fetches packages for rows staged without text.
+        if state is None or not state[1]:
+          skipped_cases += 1
+          processed_cases += 1
+          if not args.quiet:
+            print(
+              f"[skip] {index}/{len(selected_items)} {item.case_id} (nothing to enrich)",
+              file=sys.stderr,
+            )
+          continue
+      # An unchanged TOC timestamp means the package cannot have new content:
+      # skip the ZIP download entirely instead of re-fetching and re-upserting.
+      # A row still waiting for its full text never counts as unchanged, so a
+      # plain run after --toc-only completes it.
+      elif (
+        not args.refresh_existing
+        and item.modified
+        and state is not None
+        and state[0] == item.modified
+        and (args.toc_only or not state[1])
+      ):
+        skipped_cases += 1
+        processed_cases += 1
+        if not args.quiet:
+          print(
+            f"[unchanged] {index}/{len(selected_items)} {item.case_id} (toc modified {item.modified})",
+            file=sys.stderr,
+          )
+        continue
+      if args.max_cases is not None and args.max_cases >= 0 and len(pending_items) >= args.max_cases:
         break
-
-      if not args.quiet:
-        print(
-          f"[ingest] {index}/{len(selected_items)} {item.case_id} :: {item.court or '-'}",
-          file=sys.stderr,
-        )
-
-      zip_payload = http_get(item.zip_url, timeout=args.timeout, retries=args.retries)
-      parsed_case = parse_case_package(item, zip_payload)
-      upsert_case(connection, parsed_case)
-      ingested_cases += 1
-      processed_cases += 1
-
-      if args.sleep_seconds > 0:
-        time.sleep(args.sleep_seconds)
-    except Exception as error:  # noqa: BLE001
-      error_count += 1
-      processed_cases += 1
-      message = f"{item.case_id}: {error}"
-      errors.append(message)
-      if not args.quiet:
-        print(f"[error] {message}", file=sys.stderr)
-
-  finished_at = now_iso()
-  status = "success"
-  if error_count > 0 and ingested_cases == 0:
-    status = "failed"
-  elif error_count > 0:
-    status = "partial_success"
-
-  finalize_ingestion_run(
-    connection=connection,
-    run_id=run_id,
-    finished_at=finished_at,
-    status=status,
-    ingested_cases=ingested_cases,
-    skipped_cases=skipped_cases,
-    error_count=error_count,
-    error_sample=errors,
-  )
-  connection.commit()
-  connection.close()
+      pending_items.append(item)
+
+    commit_every = max(1, args.commit_every)
+    batch_count = 0
+    pending_rows: list[tuple] = []
+    # The write transaction opens lazily, right before a flush, so the WAL
+    # write lock is never held while this thread is blocked on the queue.
+    in_txn = False
+
+    if args.toc_only:
+      # Stage rows from the TOC fields alone; no download pool is started and
+      # text_snippet stays NULL until an --enrich pass fills it.
+      for completed, item in enumerate(pending_items, start=1):
+        if not args.quiet:
+          print(
+            f"[ingest] {completed}/{len(pending_items)} {item.case_id} (toc only)",
+            file=sys.stderr,
+          )
+        queue_case(pending_rows, build_toc_case(item))
+        processed_cases += 1
+        batch_count += 1
+        if len(pending_rows) >= FLUSH_EVERY or batch_count >= commit_every:
+          try:
+            if not in_txn:
+              connection.execute("BEGIN IMMEDIATE")
+              in_txn = True
+            ingested_cases += flush_cases(connection, pending_rows)
+          except Exception as error:  # noqa: BLE001
+            connection.rollback()
+            in_txn = False
+            batch_count = 0
+            message = f"flush of {len(pending_rows)} cases failed: {error}"
+            pending_rows.clear()
+            record_error(message)
+            continue
+          if batch_count >= commit_every:
+            connection.commit()
+            in_txn = False
+            batch_count = 0
+    else:
+      # Workers overlap the latency-bound downloads; parsing and all SQLite
+      # writes stay on this thread. The bounded queue gives the writer a steady
+      # feed while capping how many ZIP payloads can wait in memory.
+      executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.workers))
+      results: queue.Queue = queue.Queue(maxsize=max(1, args.workers) * 2)
+
+      def produce(item: TocItem) -> None:
+        try:
+          if args.sleep_seconds > 0:
+            time.sleep(args.sleep_seconds)
+          results.put((item, http_get(item.zip_url, timeout=args.timeout, retries=args.retries), None))
+        except BaseException as error:  # noqa: BLE001
+          results.put((item, None, error))
+
+      for item in pending_items:
+        executor.submit(produce, item)
+
+      try:
+        for completed in range(1, len(pending_items) + 1):
+          if in_txn and results.empty():
+            # Downloads are pacing the loop; release the write lock instead of
+            # holding it across the wait so sibling WAL writers can commit.
+            connection.commit()
+            in_txn = False
+            batch_count = 0
+          item, zip_payload, fetch_error = results.get()
+          if fetch_error is None:
+            try:
+              parsed_case = parse_case_package(item, zip_payload)
+            except Exception as error:  # noqa: BLE001
+              fetch_error = error
+          if fetch_error is not None:
+            # Download/parse failures never touched the database; the open batch
+            # stays valid.
+            processed_cases += 1
+            record_error(f"{item.case_id}: {fetch_error}")
+            continue
+
+          if not args.quiet:
+            print(
+              f"[ingest] {completed}/{len(pending_items)} {item.case_id} :: {item.court or '-'}",
+              file=sys.stderr,
+            )
+
+          queue_case(pending_rows, parsed_case)
+          processed_cases += 1
+          batch_count += 1
+          if len(pending_rows) >= FLUSH_EVERY or batch_count >= commit_every:
+            try:
+              if not in_txn:
+                connection.execute("BEGIN IMMEDIATE")
+                in_txn = True
+              ingested_cases += flush_cases(connection, pending_rows)
+            except Exception as error:  # noqa: BLE001
+              # A write failure poisons the current batch: roll it back and let
+              # the next flush open a fresh transaction.
+              connection.rollback()
+              in_txn = False
+              batch_count = 0
+              message = f"flush of {len(pending_rows)} cases failed: {error}"
+              pending_rows.clear()
+              record_error(message)
+              continue
+            if batch_count >= commit_every:
+              connection.commit()
+              in_txn = False
+              batch_count = 0
+      except BaseException:
+        # Any unwind — not just Ctrl-C, but also a sqlite3.Error escaping a
+        # BEGIN or commit — must drain the queue, or producers stuck in
+        # results.put() keep the process alive after the failure is reported.
+        if in_txn:
+          connection.rollback()
+          in_txn = False
+        executor.shutdown(wait=False, cancel_futures=True)
+        # Unblock producers stuck on a full queue; with maxsize at twice the
+        # worker count, one drain leaves room for every in-flight put.
+        while True:
+          try:
+            results.get_nowait()
+          except queue.Empty:
+            break
+        raise
+      executor.shutdown(wait=True)
+    if pending_rows:
+      try:
+        if not in_txn:
+          connection.execute("BEGIN IMMEDIATE")
+          in_txn = True
+        ingested_cases += flush_cases(connection, pending_rows)
+      except Exception as error:  # noqa: BLE001
+        connection.rollback()
+        in_txn = False
+        record_error(f"flush of {len(pending_rows)} cases failed: {error}")
+        pending_rows.clear()
+    if in_txn:
+      connection.commit()
+      in_txn = False
+
+    if args.bulk:
+      try:
+        end_bulk_fts(connection)
+        bulk_finalized = True
+      except Exception as error:  # noqa: BLE001
+        record_error(f"bulk finalize: {error}")
+
+    finished_at = now_iso()
+    status = "success"
+    if error_count > 0 and ingested_cases == 0:
+      status = "failed"
+    elif error_count > 0:
+      status = "partial_success"
+
+    finalize_ingestion_run(
+      connection=connection,
+      run_id=run_id,
+      finished_at=finished_at,
+      status=status,
+      ingested_cases=ingested_cases,
+      skipped_cases=skipped_cases,
+      error_count=error_count,
+      error_sample=list(errors),
+    )
+  finally:
+    if error_log is not None:
+      error_log.close()
+    if args.bulk and not bulk_finalized:
+      # The run is unwinding with the FTS triggers still dropped; cases
+      # committed so far would otherwise stay missing from the index, since
+      # the unchanged-skip never rewrites them. Restore and rebuild first.
+      connection.rollback()
+      try:
+        end_bulk_fts(connection)
+      except sqlite3.Error:
+        pass
+    if args.unsafe_fast:
+      end_unsafe_fast(connection)
+    close_connection(connection)
 
   return {
     "started_at": started_at,
@@ -649,17 +1233,20 @@ def run_ingestion(args: argparse.Namespace) -> dict[str, object]:
     "db_path": args.db_path,
     "toc_total_cases": len(toc_items),
     "selected_cases": processed_cases if not args.dry_run else len(selected_items),
-    "existing_cases_before_run": len(existing_ids),
+    "existing_cases_before_run": existing_count_before,
     "ingested_cases": ingested_cases,
     "skipped_cases": skipped_cases,
     "stop_reason": stop_reason,
     "error_count": error_count,
-    "error_sample": errors[:10],
+    "error_sample": list(errors)[:10],
+    "error_log_path": args.error_log_path,
   }
 
 
 def main(argv: list[str]) -> int:
   args = parse_args(argv)
+  if args.server:
+    return run_server()
   try:
     summary = run_ingestion(args)
   except Exception as error:  # noqa: BLE001